@@ -8,8 +8,8 @@ import os
 import math
 import requests
 import time
-import random
 import zipfile
+import hashlib
 import shutil
 import tempfile
 import json
@@ -21,12 +21,15 @@ import pandas as pd
 import geopandas as gpd
 import pyproj
 from affine import Affine
+from rasterio.features import rasterize
+from scipy.ndimage import find_objects
 import xarray as xr
+import dask
+import dask.array as da
 from dask.diagnostics import ProgressBar
 import xclim.indices as xci
 from dateutil.relativedelta import relativedelta
 from contextlib import contextmanager
-from calendar import monthrange
 from numcodecs import Blosc
 
 from hydromt.models.model_grid import GridModel
@@ -41,8 +44,11 @@ from honeybees.library.raster import sample_from_map
 from isimip_client.client import ISIMIPClient
 
 from .workflows.general import (
-    repeat_grid,
-    clip_with_grid,
+    repeat_grid_view,
+    block_mean_and_std,
+    find_nearest_index,
+    fit_gev,
+    downscale_longwave,
     pad_xy,
     calculate_cell_area,
     fetch_and_save,
@@ -55,6 +61,125 @@ from .workflows.soilgrids import load_soilgrids
 
 XY_CHUNKSIZE = 350
 
+# ISO3 codes for the country names used in the Lowder farm size database,
+# kept as a module-level Series so the mapping is built once
+ISO3_CODES = pd.Series(
+    {
+        "Albania": "ALB",
+        "Algeria": "DZA",
+        "American Samoa": "ASM",
+        "Argentina": "ARG",
+        "Austria": "AUT",
+        "Bahamas": "BHS",
+        "Barbados": "BRB",
+        "Belgium": "BEL",
+        "Brazil": "BRA",
+        "Bulgaria": "BGR",
+        "Burkina Faso": "BFA",
+        "Chile": "CHL",
+        "Colombia": "COL",
+        "Côte d'Ivoire": "CIV",
+        "Croatia": "HRV",
+        "Cyprus": "CYP",
+        "Czech Republic": "CZE",
+        "Democratic Republic of the Congo": "COD",
+        "Denmark": "DNK",
+        "Dominica": "DMA",
+        "Ecuador": "ECU",
+        "Egypt": "EGY",
+        "Estonia": "EST",
+        "Ethiopia": "ETH",
+        "Fiji": "FJI",
+        "Finland": "FIN",
+        "France": "FRA",
+        "French Polynesia": "PYF",
+        "Georgia": "GEO",
+        "Germany": "DEU",
+        "Greece": "GRC",
+        "Grenada": "GRD",
+        "Guam": "GUM",
+        "Guatemala": "GTM",
+        "Guinea": "GIN",
+        "Honduras": "HND",
+        "India": "IND",
+        "Indonesia": "IDN",
+        "Iran (Islamic Republic of)": "IRN",
+        "Ireland": "IRL",
+        "Italy": "ITA",
+        "Japan": "JPN",
+        "Jamaica": "JAM",
+        "Jordan": "JOR",
+        "Korea, Rep. of": "KOR",
+        "Kyrgyzstan": "KGZ",
+        "Lao People's Democratic Republic": "LAO",
+        "Latvia": "LVA",
+        "Lebanon": "LBN",
+        "Lithuania": "LTU",
+        "Luxembourg": "LUX",
+        "Malta": "MLT",
+        "Morocco": "MAR",
+        "Myanmar": "MMR",
+        "Namibia": "NAM",
+        "Nepal": "NPL",
+        "Netherlands": "NLD",
+        "Nicaragua": "NIC",
+        "Northern Mariana Islands": "MNP",
+        "Norway": "NOR",
+        "Pakistan": "PAK",
+        "Panama": "PAN",
+        "Paraguay": "PRY",
+        "Peru": "PER",
+        "Philippines": "PHL",
+        "Poland": "POL",
+        "Portugal": "PRT",
+        "Puerto Rico": "PRI",
+        "Qatar": "QAT",
+        "Romania": "ROU",
+        "Saint Lucia": "LCA",
+        "Saint Vincent and the Grenadines": "VCT",
+        "Samoa": "WSM",
+        "Senegal": "SEN",
+        "Serbia": "SRB",
+        "Sweden": "SWE",
+        "Switzerland": "CHE",
+        "Thailand": "THA",
+        "Trinidad and Tobago": "TTO",
+        "Turkey": "TUR",
+        "Uganda": "UGA",
+        "United Kingdom": "GBR",
+        "United States of America": "USA",
+        "Uruguay": "URY",
+        "Venezuela (Bolivarian Republic of)": "VEN",
+        "Virgin Islands, United States": "VIR",
+        "Yemen": "YEM",
+        "Cook Islands": "COK",
+        "French Guiana": "GUF",
+        "Guadeloupe": "GLP",
+        "Martinique": "MTQ",
+        "Réunion": "REU",
+        "Canada": "CAN",
+        "China": "CHN",
+        "Guinea Bissau": "GNB",
+        "Hungary": "HUN",
+        "Lesotho": "LSO",
+        "Libya": "LBY",
+        "Malawi": "MWI",
+        "Mozambique": "MOZ",
+        "New Zealand": "NZL",
+        "Slovakia": "SVK",
+        "Slovenia": "SVN",
+        "Spain": "ESP",
+        "St. Kitts & Nevis": "KNA",
+        "Viet Nam": "VNM",
+        "Australia": "AUS",
+        "Djibouti": "DJI",
+        "Mali": "MLI",
+        "Togo": "TGO",
+        "Zambia": "ZMB",
+    },
+    name="ISO3",
+)
+
 # temporary fix for ESMF on Windows
 if os.name == "nt":
     os.environ["ESMFMKFILE"] = str(
@@ -119,6 +244,11 @@ class GEBModel(GridModel):
         self._subgrid = None
         self._region_subgrid = None
         self._MERIT_grid = None
+        self._interpolation_target_cache = {}
+        self._merit_window_cache = {}
+        self._isimip_cache = {}
+        self._regridder_cache = {}
+        self._pyproj_crs = None
 
         self.table = {}
         self.binary = {}
@@ -233,50 +363,64 @@ class GEBModel(GridModel):
                 f"Region for grid must of kind [basin, subbasin], kind {kind} not understood."
             )
 
-        self.logger.info(
-            f"Approximate basin size in km2: {round(geom.to_crs(epsg=3857).area.sum() / 1e6, 2)}"
+        geod = pyproj.Geod(ellps="WGS84")
+        basin_area = sum(
+            abs(geod.geometry_area_perimeter(geometry)[0])
+            for geometry in geom.to_crs(epsg=4326).geometry
         )
+        self.logger.info(f"Basin size in km2: {round(basin_area / 1e6, 2)}")
 
         # Add region and grid to model
         self.set_geoms(geom, name="region")
 
+        # clip to the bounding box first; for tiled remote (COG) sources this
+        # restricts the read to the window tiles before the precise polygon
+        # mask is applied in memory
+        hydrography = hydrography.raster.clip_bbox(tuple(geom.total_bounds))
         hydrography = hydrography.raster.clip_geom(geom, mask=True)
 
-        ldd = hydrography["flwdir"].raster.reclassify(
-            reclass_table=pd.DataFrame(
-                index=[
-                    0,
-                    1,
-                    2,
-                    4,
-                    8,
-                    16,
-                    32,
-                    64,
-                    128,
-                    hydrography["flwdir"].raster.nodata,
-                ],
-                data={"ldd": [5, 6, 3, 2, 1, 4, 7, 8, 9, 0]},
-            ),
-            method="exact",
-        )["ldd"]
+        # reclassify the power-of-two flow direction codes to LDD with a
+        # direct lookup table; a single gather instead of one masked pass per
+        # class. Codes not in the table, including nodata, map to 0.
+        flwdir = hydrography["flwdir"]
+        reclass_lut = np.zeros(256, dtype=np.int8)
+        reclass_lut[[0, 1, 2, 4, 8, 16, 32, 64, 128]] = [5, 6, 3, 2, 1, 4, 7, 8, 9]
+        ldd = xr.DataArray(
+            reclass_lut[flwdir.values.astype(np.uint8)],
+            coords=flwdir.coords,
+            dims=flwdir.dims,
+            name="ldd",
+        )
+        ldd.raster.set_nodata(0)
 
-        self.set_grid(ldd, name="routing/kinematic/ldd")
-        self.set_grid(hydrography["uparea"], name="routing/kinematic/upstream_area")
-        self.set_grid(hydrography["elevtn"], name="routing/kinematic/outflow_elevation")
+        # insert all routing layers in one batched call, so the grid dataset
+        # is aligned and validated once instead of once per layer
         self.set_grid(
-            xr.where(
-                hydrography["rivlen_ds"] != -9999,
-                hydrography["rivlen_ds"],
-                np.nan,
-                keep_attrs=True,
-            ),
-            name="routing/kinematic/channel_length",
+            xr.Dataset(
+                {
+                    "routing/kinematic/ldd": ldd,
+                    "routing/kinematic/upstream_area": hydrography["uparea"],
+                    "routing/kinematic/outflow_elevation": hydrography["elevtn"],
+                    "routing/kinematic/channel_length": xr.where(
+                        hydrography["rivlen_ds"] != -9999,
+                        hydrography["rivlen_ds"],
+                        np.nan,
+                        keep_attrs=True,
+                    ),
+                    "routing/kinematic/channel_slope": hydrography["rivslp"],
+                }
+            )
         )
-        self.set_grid(hydrography["rivslp"], name="routing/kinematic/channel_slope")
 
         # hydrography['mask'].raster.set_nodata(-1)
-        self.set_grid((~hydrography["mask"]).astype(np.int8), name="areamaps/grid_mask")
+        # invert the boolean mask and cast in one pass rather than allocating
+        # an intermediate boolean array with ~ before the astype
+        grid_mask = hydrography["mask"].copy(
+            data=np.subtract(
+                1, np.asarray(hydrography["mask"].values).view(np.uint8), dtype=np.int8
+            )
+        )
+        self.set_grid(grid_mask, name="areamaps/grid_mask")
 
         mask = self.grid["areamaps/grid_mask"]
 
@@ -295,7 +439,7 @@ class GEBModel(GridModel):
             lazy=True,
         )
         submask.raster.set_nodata(None)
-        submask.data = repeat_grid(mask.data, sub_grid_factor)
+        submask.data = repeat_grid_view(mask.data, sub_grid_factor)
 
         assert bounds_are_within(submask.raster.bounds, mask.raster.bounds)
         assert bounds_are_within(mask.raster.bounds, submask.raster.bounds)
@@ -319,8 +463,8 @@ class GEBModel(GridModel):
         attribute of the grid.
 
         Additionally, this method sets up a subgrid for the cell area map by creating a new grid with the same extent as
-        the subgrid, and then repeating the cell area values from the main grid to the subgrid using the `repeat_grid()`
-        function, and correcting for the subgrid factor. Thus, every subgrid cell within a grid cell has the same value.
+        the subgrid, and then repeating the cell area values from the main grid to the subgrid using the
+        `repeat_grid_view()` function, and correcting for the subgrid factor. Thus, every subgrid cell within a grid cell has the same value.
         The resulting subgrid cell area map is then set as the `areamaps/sub_cell_area` attribute of the subgrid.
         """
         self.logger.info("Preparing cell area map.")
@@ -345,8 +489,10 @@ class GEBModel(GridModel):
             lazy=True,
         )
 
-        sub_cell_area.data = (
-            repeat_grid(cell_area.data, self.subgrid_factor) / self.subgrid_factor**2
+        # divide on the small grid first so the broadcasted subgrid is only
+        # written once
+        sub_cell_area.data = repeat_grid_view(
+            cell_area.data / self.subgrid_factor**2, self.subgrid_factor
         )
         self.set_subgrid(sub_cell_area, sub_cell_area.name)
 
@@ -580,7 +726,7 @@ class GEBModel(GridModel):
 
                 formatted_data["data"][region_id] = region_dict
 
-            data = formatted_data.copy()
+            data = formatted_data
 
         # data is a file path
         elif isinstance(crop_prices, str):
@@ -1076,12 +1222,9 @@ class GEBModel(GridModel):
         `set_grid()` method.
         """
         self.logger.info("Setting up Manning's coefficient")
-        a = (2 * self.grid["areamaps/cell_area"]) / self.grid[
-            "routing/kinematic/upstream_area"
-        ]
-        a = xr.where(a < 1, a, 1, keep_attrs=True)
-        b = self.grid["routing/kinematic/outflow_elevation"] / 2000
-        b = xr.where(b < 1, b, 1, keep_attrs=True)
+        cell_area = self.grid["areamaps/cell_area"].values
+        upstream_area = self.grid["routing/kinematic/upstream_area"].values
+        elevation = self.grid["routing/kinematic/outflow_elevation"].values
 
         mannings = hydromt.raster.full(
             self.grid.raster.coords,
@@ -1090,7 +1233,20 @@ class GEBModel(GridModel):
             name="routing/kinematic/mannings",
             lazy=True,
         )
-        mannings.data = 0.025 + 0.015 * a + 0.030 * b
+        # nothing reads the Manning's grid during setup, so leave it as a lazy
+        # dask expression that is only evaluated when the grid is written
+        mannings.data = (
+            0.025
+            + 0.015
+            * da.minimum(
+                2
+                * da.from_array(cell_area, chunks=XY_CHUNKSIZE)
+                / da.from_array(upstream_area, chunks=XY_CHUNKSIZE),
+                1,
+            )
+            + 0.030
+            * da.minimum(da.from_array(elevation, chunks=XY_CHUNKSIZE) / 2000, 1)
+        )
         self.set_grid(mannings, mannings.name)
 
     def setup_channel_width(self, minimum_width: float) -> None:
@@ -1117,12 +1273,8 @@ class GEBModel(GridModel):
         minimum width with the minimum width.
         """
         self.logger.info("Setting up channel width")
-        channel_width_data = self.grid["routing/kinematic/upstream_area"] / 500
-        channel_width_data = xr.where(
-            channel_width_data > minimum_width,
-            channel_width_data,
-            minimum_width,
-            keep_attrs=True,
+        channel_width_data = np.maximum(
+            self.grid["routing/kinematic/upstream_area"].values / 500, minimum_width
         )
 
         channel_width = hydromt.raster.full(
@@ -1165,7 +1317,13 @@ class GEBModel(GridModel):
             (self.grid["routing/kinematic/upstream_area"] > 0)
             | ~self.grid["areamaps/grid_mask"]
         ).all()
-        channel_depth_data = 0.27 * self.grid["routing/kinematic/upstream_area"] ** 0.26
+        # exp(0.26 * log(A)) avoids the much slower generic pow for the
+        # fractional exponent; cells outside the mask become NaN as before.
+        # The expression stays lazy until the grid is written.
+        upstream_area = da.from_array(
+            self.grid["routing/kinematic/upstream_area"].values, chunks=XY_CHUNKSIZE
+        )
+        channel_depth_data = 0.27 * da.exp(0.26 * da.log(upstream_area))
         channel_depth = hydromt.raster.full(
             self.grid.raster.coords,
             nodata=np.nan,
@@ -1208,14 +1366,15 @@ class GEBModel(GridModel):
             | ~self.grid["areamaps/grid_mask"]
         ).all()
         channel_area = (
-            self.grid["routing/kinematic/channel_width"]
-            * self.grid["routing/kinematic/channel_length"]
+            self.grid["routing/kinematic/channel_width"].values
+            * self.grid["routing/kinematic/channel_length"].values
         )
-        channel_ratio_data = channel_area / self.grid["areamaps/cell_area"]
-        channel_ratio_data = xr.where(
-            channel_ratio_data < 1, channel_ratio_data, 1, keep_attrs=True
+        channel_ratio_data = np.minimum(
+            channel_area / self.grid["areamaps/cell_area"].values, 1
         )
-        assert ((channel_ratio_data >= 0) | ~self.grid["areamaps/grid_mask"]).all()
+        assert (
+            (channel_ratio_data >= 0) | ~self.grid["areamaps/grid_mask"].values
+        ).all()
         channel_ratio = hydromt.raster.full(
             self.grid.raster.coords,
             nodata=np.nan,
@@ -1278,28 +1437,42 @@ class GEBModel(GridModel):
 
         scaling = 10
 
-        # find the upper left corner of the grid cells in self.grid
-        y_step = self.grid.get_index("y")[1] - self.grid.get_index("y")[0]
-        x_step = self.grid.get_index("x")[1] - self.grid.get_index("x")[0]
-        upper_left_y = self.grid.get_index("y")[0] - y_step / 2
-        upper_left_x = self.grid.get_index("x")[0] - x_step / 2
-
-        ymin = np.isclose(
-            MERIT_ul.get_index("y"), upper_left_y, atol=MERIT.rio.resolution()[1] / 100
+        # the alignment between the model grid and the MERIT window is fully
+        # determined by the two transforms and the grid shape, so reuse it on
+        # repeated invocations (e.g. parameter sweeps on the same region)
+        window_key = (
+            self.grid.raster.transform.to_gdal(),
+            MERIT.rio.transform().to_gdal(),
+            self.grid.raster.shape,
         )
-        assert (
-            ymin.sum() == 1
-        ), "Could not find the upper left corner of the grid cell in MERIT data"
-        ymin = ymin.argmax()
-        ymax = ymin + self.grid.y.size * scaling
-        xmin = np.isclose(
-            MERIT_ul.get_index("x"), upper_left_x, atol=MERIT.rio.resolution()[0] / 100
-        )
-        assert (
-            xmin.sum() == 1
-        ), "Could not find the upper left corner of the grid cell in MERIT data"
-        xmin = xmin.argmax()
-        xmax = xmin + self.grid.x.size * scaling
+        if window_key in self._merit_window_cache:
+            ymin, ymax, xmin, xmax = self._merit_window_cache[window_key]
+        else:
+            # find the upper left corner of the grid cells in self.grid
+            grid_y = self.grid.get_index("y")
+            grid_x = self.grid.get_index("x")
+            y_step = grid_y[1] - grid_y[0]
+            x_step = grid_x[1] - grid_x[0]
+            upper_left_y = grid_y[0] - y_step / 2
+            upper_left_x = grid_x[0] - x_step / 2
+
+            MERIT_ul_y = MERIT_ul.get_index("y")
+            ymin = find_nearest_index(MERIT_ul_y, upper_left_y)
+            assert np.isclose(
+                MERIT_ul_y[ymin],
+                upper_left_y,
+                atol=abs(MERIT.rio.resolution()[1]) / 100,
+            ), "Could not find the upper left corner of the grid cell in MERIT data"
+            ymax = ymin + self.grid.y.size * scaling
+            MERIT_ul_x = MERIT_ul.get_index("x")
+            xmin = find_nearest_index(MERIT_ul_x, upper_left_x)
+            assert np.isclose(
+                MERIT_ul_x[xmin],
+                upper_left_x,
+                atol=abs(MERIT.rio.resolution()[0]) / 100,
+            ), "Could not find the upper left corner of the grid cell in MERIT data"
+            xmax = xmin + self.grid.x.size * scaling
+            self._merit_window_cache[window_key] = (ymin, ymax, xmin, xmax)
 
         # select data from MERIT using the grid coordinates
         high_res_elevation_data = MERIT.isel(y=slice(ymin, ymax), x=slice(xmin, xmax))
@@ -1308,9 +1481,15 @@ class GEBModel(GridModel):
             name="landsurface/topo/subgrid_elevation",
         )
 
-        elevation_per_cell = high_res_elevation_data.values.reshape(
-            high_res_elevation_data.shape[0] // scaling, scaling, -1, scaling
-        ).swapaxes(1, 2)
+        # force one contiguous materialization of the sliced window so the
+        # reduction kernel reads sequential memory rather than a strided view
+        high_res_elevation_values = np.ascontiguousarray(high_res_elevation_data.values)
+
+        # single streaming pass over the high-resolution data that yields
+        # both the block mean and the block standard deviation
+        elevation_per_cell_mean, elevation_per_cell_std = block_mean_and_std(
+            high_res_elevation_values, scaling
+        )
 
         elevation = hydromt.raster.full(
             self.grid.raster.coords,
@@ -1319,7 +1498,7 @@ class GEBModel(GridModel):
             name="landsurface/topo/elevation",
             lazy=True,
         )
-        elevation.data = np.mean(elevation_per_cell, axis=(2, 3))
+        elevation.data = elevation_per_cell_mean
         self.set_grid(elevation, elevation.name)
 
         standard_deviation = hydromt.raster.full(
@@ -1329,7 +1508,7 @@ class GEBModel(GridModel):
             name="landsurface/topo/elevation_STD",
             lazy=True,
         )
-        standard_deviation.data = np.std(elevation_per_cell, axis=(2, 3))
+        standard_deviation.data = elevation_per_cell_std
         self.set_grid(standard_deviation, standard_deviation.name)
 
     def setup_soil_parameters(self) -> None:
@@ -1415,6 +1594,10 @@ class GEBModel(GridModel):
         where {land_use_type_netcdf_name} is the name of the land use type in the CWATM dataset.
         """
         self.logger.info("Setting up land use parameters")
+        # the interpolations are independent of each other, so collect them as
+        # delayed tasks and compute them in one parallel pass
+        tasks = []
+        names = []
         for land_use_type, land_use_type_netcdf_name in (
             ("forest", "Forest"),
             ("grassland", "Grassland"),
@@ -1426,17 +1609,19 @@ class GEBModel(GridModel):
                 f"cwatm_{land_use_type}_5min", bbox=self.bounds, buffer=10
             )
 
-            parameter = f"cropCoefficient{land_use_type_netcdf_name}_10days"
-            self.set_forcing(
-                self.interpolate(land_use_ds[parameter], interpolation_method),
-                name=f"landcover/{land_use_type}/{parameter}",
-            )
+            parameters = [f"cropCoefficient{land_use_type_netcdf_name}_10days"]
             if land_use_type in ("forest", "grassland"):
-                parameter = f"interceptCap{land_use_type_netcdf_name}_10days"
-                self.set_forcing(
-                    self.interpolate(land_use_ds[parameter], interpolation_method),
-                    name=f"landcover/{land_use_type}/{parameter}",
+                parameters.append(f"interceptCap{land_use_type_netcdf_name}_10days")
+            for parameter in parameters:
+                tasks.append(
+                    dask.delayed(self.interpolate)(
+                        land_use_ds[parameter], interpolation_method
+                    )
                 )
+                names.append(f"landcover/{land_use_type}/{parameter}")
+
+        for name, interpolated in zip(names, dask.compute(*tasks, scheduler="threads")):
+            self.set_forcing(interpolated, name=name)
 
     def setup_waterbodies(
         self,
@@ -1465,10 +1650,11 @@ class GEBModel(GridModel):
         """
         self.logger.info("Setting up waterbodies")
         try:
+            # a bounding-box filter is pushed down to the reader's spatial
+            # index; the exact intersects test then only runs on the subset
             waterbodies = self.data_catalog.get_geodataframe(
                 "hydro_lakes",
-                geom=self.region,
-                predicate="intersects",
+                bbox=self.region.total_bounds,
                 variables=[
                     "waterbody_id",
                     "waterbody_type",
@@ -1477,6 +1663,11 @@ class GEBModel(GridModel):
                     "average_area",
                 ],
             )
+            waterbodies = waterbodies[
+                waterbodies.intersects(self.region.unary_union)
+            ].reset_index(drop=True)
+            if len(waterbodies) == 0:
+                raise NoDataException()
         except (IndexError, NoDataException):
             self.logger.info(
                 "No water bodies found in domain, skipping water bodies setup"
@@ -1496,20 +1687,41 @@ class GEBModel(GridModel):
             sublakesResID = xr.zeros_like(self.subgrid["areamaps/sub_grid_mask"])
 
         else:
-            lakesResID = self.grid.raster.rasterize(
-                waterbodies,
-                col_name="waterbody_id",
+            # call rasterio directly with prepared (geometry, id) tuples; the
+            # hydromt wrapper re-validates and re-projects the frame per call
+            sublakesResID = hydromt.raster.full(
+                self.subgrid.raster.coords,
                 nodata=0,
+                dtype=np.int32,
+                name="routing/lakesreservoirs/sublakesResID",
+                lazy=True,
+            )
+            sublakesResID.data = rasterize(
+                zip(
+                    waterbodies.geometry.values,
+                    waterbodies["waterbody_id"].astype(np.int32).values,
+                ),
+                out_shape=sublakesResID.raster.shape,
+                transform=sublakesResID.raster.transform,
+                fill=0,
                 all_touched=True,
                 dtype=np.int32,
             )
-            sublakesResID = self.subgrid.raster.rasterize(
-                waterbodies,
-                col_name="waterbody_id",
+            # the subgrid is an exact integer refinement of the grid, so the
+            # coarse map follows from a block maximum over each cell's
+            # subcells rather than a second scanline rasterization; a
+            # waterbody touches a grid cell iff it touches one of its subcells
+            factor = self.subgrid_factor
+            lakesResID = hydromt.raster.full(
+                self.grid.raster.coords,
                 nodata=0,
-                all_touched=True,
                 dtype=np.int32,
+                name="routing/lakesreservoirs/lakesResID",
+                lazy=True,
             )
+            lakesResID.data = sublakesResID.values.reshape(
+                lakesResID.shape[0], factor, lakesResID.shape[1], factor
+            ).max(axis=(1, 3))
 
         self.set_grid(lakesResID, name="routing/lakesreservoirs/lakesResID")
         self.set_subgrid(sublakesResID, name="routing/lakesreservoirs/sublakesResID")
@@ -1528,25 +1740,43 @@ class GEBModel(GridModel):
                 np.int32
             )
 
-            self.set_grid(
-                self.grid.raster.rasterize(
-                    command_areas,
-                    col_name="waterbody_id",
-                    nodata=-1,
-                    all_touched=True,
-                    dtype=np.int32,
+            subcommand_areas = hydromt.raster.full(
+                self.subgrid.raster.coords,
+                nodata=-1,
+                dtype=np.int32,
+                name="routing/lakesreservoirs/subcommand_areas",
+                lazy=True,
+            )
+            subcommand_areas.data = rasterize(
+                zip(
+                    command_areas.geometry.values,
+                    command_areas["waterbody_id"].astype(np.int32).values,
                 ),
+                out_shape=subcommand_areas.raster.shape,
+                transform=subcommand_areas.raster.transform,
+                fill=-1,
+                all_touched=True,
+                dtype=np.int32,
+            )
+            # as for the waterbody IDs above, derive the coarse command areas
+            # from the subgrid rasterization with a block maximum
+            factor = self.subgrid_factor
+            command_areas_grid = hydromt.raster.full(
+                self.grid.raster.coords,
+                nodata=-1,
+                dtype=np.int32,
                 name="routing/lakesreservoirs/command_areas",
+                lazy=True,
+            )
+            command_areas_grid.data = subcommand_areas.values.reshape(
+                command_areas_grid.shape[0], factor, command_areas_grid.shape[1], factor
+            ).max(axis=(1, 3))
+
+            self.set_grid(
+                command_areas_grid, name="routing/lakesreservoirs/command_areas"
             )
             self.set_subgrid(
-                self.subgrid.raster.rasterize(
-                    command_areas,
-                    col_name="waterbody_id",
-                    nodata=-1,
-                    all_touched=True,
-                    dtype=np.int32,
-                ),
-                name="routing/lakesreservoirs/subcommand_areas",
+                subcommand_areas, name="routing/lakesreservoirs/subcommand_areas"
             )
 
             # set all lakes with command area to reservoir
@@ -1584,7 +1814,16 @@ class GEBModel(GridModel):
                 custom_reservoir_capacity.index != -1
             ]
 
-            waterbodies.update(custom_reservoir_capacity)
+            common_ids = waterbodies.index.intersection(custom_reservoir_capacity.index)
+            common_columns = waterbodies.columns.intersection(
+                custom_reservoir_capacity.columns
+            )
+            # like DataFrame.update, keep the existing value where the
+            # custom table has a NaN cell
+            patch = custom_reservoir_capacity.loc[common_ids, common_columns]
+            waterbodies.loc[common_ids, common_columns] = patch.where(
+                patch.notna(), waterbodies.loc[common_ids, common_columns]
+            ).to_numpy()
 
         # spatial dimension is not required anymore, so drop it.
         waterbodies = waterbodies.drop("geometry", axis=1)
@@ -1611,15 +1850,23 @@ class GEBModel(GridModel):
         """
         self.logger.info("Setting up water demand")
 
+        # the demand and consumption variables live in the same file, so hold
+        # each opened dataset and serve both variables from it rather than
+        # re-opening and re-decoding the store per variable
+        datasets = {}
+
+        def get(name):
+            if name not in datasets:
+                datasets[name] = self.data_catalog.get_rasterdataset(
+                    name, bbox=self.bounds, buffer=2
+                )
+            return datasets[name]
+
         def set(file, accessor, name, ssp, starttime, endtime):
-            ds_historic = self.data_catalog.get_rasterdataset(
-                f"cwatm_{file}_historical_year", bbox=self.bounds, buffer=2
-            )
+            ds_historic = get(f"cwatm_{file}_historical_year")
             if accessor:
                 ds_historic = getattr(ds_historic, accessor)
-            ds_future = self.data_catalog.get_rasterdataset(
-                f"cwatm_{file}_{ssp}_year", bbox=self.bounds, buffer=2
-            )
+            ds_future = get(f"cwatm_{file}_{ssp}_year")
             if accessor:
                 ds_future = getattr(ds_future, accessor)
             ds_future = ds_future.sel(
@@ -1630,9 +1877,11 @@ class GEBModel(GridModel):
             # assert dataset in monotonicically increasing
             assert (ds.time.diff("time") == 1).all(), "not all years are there"
 
+            # time is stored as integer years since 1901; build the datetime
+            # index directly instead of routing through relativedelta and a
+            # .data.item() access on the lazy coordinate
             ds["time"] = pd.date_range(
-                start=datetime(1901, 1, 1)
-                + relativedelta(years=int(ds.time[0].data.item())),
+                start=datetime(1901 + int(ds["time"].values[0]), 1, 1),
                 periods=len(ds.time),
                 freq="AS",
             )
@@ -2173,7 +2422,7 @@ class GEBModel(GridModel):
             if output_fn.exists():
                 self.logger.info(f"ERA5 data already downloaded to {output_fn}")
             else:
-                (xmin, ymin, xmax, ymax) = self.bounds
+                xmin, ymin, xmax, ymax = self.bounds
 
                 # add buffer to bounding box. Resolution is 0.1 degrees, so add 0.1 degrees to each side
                 xmin -= 0.1
@@ -2425,7 +2674,7 @@ class GEBModel(GridModel):
                 )
                 var.append(
                     self.interpolate(
-                        ds[variable].raster.clip_bbox(ds.raster.bounds),
+                        ds[variable],
                         "linear",
                         xdim="lon",
                         ydim="lat",
@@ -2448,7 +2697,7 @@ class GEBModel(GridModel):
                 )
                 var.append(
                     self.interpolate(
-                        ds[variable].raster.clip_bbox(ds.raster.bounds),
+                        ds[variable],
                         "linear",
                         xdim="lon",
                         ydim="lat",
@@ -2473,7 +2722,7 @@ class GEBModel(GridModel):
                 )
                 var.append(
                     self.interpolate(
-                        ds[variable].raster.clip_bbox(ds.raster.bounds),
+                        ds[variable],
                         "linear",
                         xdim="lon",
                         ydim="lat",
@@ -2490,18 +2739,24 @@ class GEBModel(GridModel):
             ).all(), "time is not monotonically increasing with a constant step size"
             var = var.rename({"lon": "x", "lat": "y"})
             self.logger.info(f"Completed {variable}")
+            return var
+
+        # the downloads are network-bound and independent, so they can run in
+        # parallel. set_forcing writes to the model and is called sequentially.
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(variables)
+        ) as executor:
+            downloaded = list(
+                executor.map(
+                    lambda variable: download_variable(
+                        variable, forcing, ssp, starttime, endtime
+                    ),
+                    variables,
+                )
+            )
+        for variable, var in zip(variables, downloaded):
             self.set_forcing(var, name=f"climate/{variable}")
 
-        for variable in variables:
-            download_variable(variable, forcing, ssp, starttime, endtime)
-
-        # # Create a thread pool and map the set_forcing function to the variables
-        # with concurrent.futures.ThreadPoolExecutor() as executor:
-        #     futures = [executor.submit(download_variable, variable, forcing, ssp, starttime, endtime) for variable in variables]
-
-        # # Wait for all threads to complete
-        # concurrent.futures.wait(futures)
-
     def setup_30arcsec_variables_isimip(
         self, variables: List[str], starttime: date, endtime: date
     ):
@@ -2542,21 +2797,24 @@ class GEBModel(GridModel):
                 resolution="30arcsec",
             )
             ds = ds.rename({"lon": "x", "lat": "y"})
-            var = ds[variable].raster.clip_bbox(ds.raster.bounds)
-            var = self.snap_to_grid(var, self.grid)
+            var = self.snap_to_grid(ds[variable], self.grid)
             self.logger.info(f"Completed {variable}")
+            return var
+
+        # the downloads are network-bound and independent, so they can run in
+        # parallel. set_forcing writes to the model and is called sequentially.
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(variables)
+        ) as executor:
+            downloaded = list(
+                executor.map(
+                    lambda variable: download_variable(variable, starttime, endtime),
+                    variables,
+                )
+            )
+        for variable, var in zip(variables, downloaded):
             self.set_forcing(var, name=f"climate/{variable}")
 
-        for variable in variables:
-            download_variable(variable, starttime, endtime)
-
-        # # Create a thread pool and map the set_forcing function to the variables
-        # with concurrent.futures.ThreadPoolExecutor() as executor:
-        #     futures = [executor.submit(download_variable, variable, starttime, endtime) for variable in variables]
-
-        # # Wait for all threads to complete
-        # concurrent.futures.wait(futures)
-
     def setup_hurs_isimip_30arcsec(self, starttime: date, endtime: date):
         """
         Sets up the relative humidity data for GEB.
@@ -2592,7 +2850,12 @@ class GEBModel(GridModel):
             endtime=endtime,
             forcing="w5e5v2.0",
             buffer=1,
+        ).astype(
+            np.float32
         )  # some buffer to avoid edge effects / errors in ISIMIP API
+        # rechunk along time only; xESMF streams per chunk and needs the full
+        # spatial extent in each block
+        hurs_30_min = hurs_30_min.chunk({"time": 365, "lat": -1, "lon": -1})
 
         # just taking the years to simplify things
         start_year = starttime.year
@@ -2610,100 +2873,100 @@ class GEBModel(GridModel):
         self.logger.info(
             "Downloading/reading monthly CHELSA-BIOCLIM+ hurs data at 30 arcsec resolution"
         )
-        hurs_ds_30sec, hurs_time = [], []
-        for year in tqdm(range(start_year, end_year + 1)):
-            for month in range(1, 13):
-                fn = chelsa_folder / f"hurs_{year}_{month:02d}.zarr.zip"
-                if not fn.exists():
-                    hurs = self.data_catalog.get_rasterdataset(
-                        f"CHELSA-BIOCLIM+_monthly_hurs_{month:02d}_{year}",
-                        bbox=hurs_30_min.raster.bounds,
-                        buffer=1,
-                    )
-                    del hurs.attrs["_FillValue"]
-                    hurs.name = "hurs"
-                    hurs.to_zarr(fn)
-                else:
-                    hurs = xr.open_dataset(fn, chunks={}, engine="zarr")["hurs"]
-                # assert hasattr(hurs, "spatial_ref")
-                hurs_ds_30sec.append(hurs)
-                hurs_time.append(f"{year}-{month:02d}")
+
+        def fetch_chelsa_hurs(year, month):
+            fn = chelsa_folder / f"hurs_{year}_{month:02d}.zarr.zip"
+            if not fn.exists():
+                hurs = self.data_catalog.get_rasterdataset(
+                    f"CHELSA-BIOCLIM+_monthly_hurs_{month:02d}_{year}",
+                    bbox=hurs_30_min.raster.bounds,
+                    buffer=1,
+                )
+                del hurs.attrs["_FillValue"]
+                hurs.name = "hurs"
+                hurs.to_zarr(fn)
+            else:
+                hurs = xr.open_dataset(fn, chunks={}, engine="zarr")["hurs"]
+            # assert hasattr(hurs, "spatial_ref")
+            return hurs
+
+        # the per-month fetches are independent and network/disk bound, so
+        # run them through a thread pool while preserving time order
+        months = [
+            (year, month)
+            for year in range(start_year, end_year + 1)
+            for month in range(1, 13)
+        ]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            hurs_ds_30sec = list(
+                tqdm(
+                    executor.map(lambda ym: fetch_chelsa_hurs(*ym), months),
+                    total=len(months),
+                )
+            )
+        hurs_time = [f"{year}-{month:02d}" for year, month in months]
 
         hurs_ds_30sec = xr.concat(hurs_ds_30sec, dim="time").rename(
             {"x": "lon", "y": "lat"}
         )
-        hurs_ds_30sec.rio.set_spatial_dims("lon", "lat", inplace=True)
         hurs_ds_30sec["time"] = pd.date_range(hurs_time[0], hurs_time[-1], freq="MS")
 
         hurs_output = xr.full_like(self.forcing["climate/tas"], np.nan)
         hurs_output.name = "hurs"
         hurs_output.attrs = {"units": "%", "long_name": "Relative humidity"}
 
-        hurs_output = hurs_output.rename({"x": "lon", "y": "lat"}).rio.set_spatial_dims(
-            "lon", "lat"
-        )
+        hurs_output = hurs_output.rename({"x": "lon", "y": "lat"})
 
-        import xesmf as xe
-
-        regridder = xe.Regridder(
+        regridder = self._get_regridder(
             hurs_30_min.isel(time=0).drop_vars("time"),
             hurs_ds_30sec.isel(time=0).drop_vars("time"),
-            "bilinear",
         )
-        for year in tqdm(range(start_year, end_year + 1)):
-            for month in range(1, 13):
-                start_month = datetime(year, month, 1)
-                end_month = datetime(year, month, monthrange(year, month)[1])
 
-                w5e5_30min_sel = hurs_30_min.sel(time=slice(start_month, end_month))
-                w5e5_regridded = (
-                    regridder(w5e5_30min_sel, output_chunks=(-1, -1)) * 0.01
-                )  # convert to fraction
-                assert (
-                    w5e5_regridded >= 0.1
-                ).all(), "too low values in relative humidity"
-                assert (w5e5_regridded <= 1).all(), "relative humidity > 1"
-
-                w5e5_regridded_mean = w5e5_regridded.mean(
-                    dim="time"
-                )  # get monthly mean
-                w5e5_regridded_tr = np.log(
-                    w5e5_regridded / (1 - w5e5_regridded)
-                )  # assume beta distribuation => logit transform
-                w5e5_regridded_mean_tr = np.log(
-                    w5e5_regridded_mean / (1 - w5e5_regridded_mean)
-                )  # logit transform
-
-                chelsa = (
-                    hurs_ds_30sec.sel(time=start_month) * 0.0001
-                )  # convert to fraction
-                assert (chelsa >= 0.1).all(), "too low values in relative humidity"
-                assert (chelsa <= 1).all(), "relative humidity > 1"
-
-                chelsa_tr = np.log(
-                    chelsa / (1 - chelsa)
-                )  # assume beta distribuation => logit transform
-
-                difference = chelsa_tr - w5e5_regridded_mean_tr
-
-                # apply difference to w5e5
-                w5e5_regridded_tr_corr = w5e5_regridded_tr + difference
-                w5e5_regridded_corr = (
-                    1 / (1 + np.exp(-w5e5_regridded_tr_corr))
-                ) * 100  # back transform
-                w5e5_regridded_corr.raster.set_crs(4326)
-                w5e5_regridded_corr_clipped = w5e5_regridded_corr[
-                    "hurs"
-                ].raster.clip_bbox(hurs_output.raster.bounds)
-                w5e5_regridded_corr_clipped = (
-                    w5e5_regridded_corr_clipped.rio.set_spatial_dims("lon", "lat")
-                )
+        # regrid the full time series in one go rather than re-invoking the
+        # regridder per month; the logit correction is then a single
+        # broadcasted expression over the whole (time, lat, lon) cube
+        w5e5_regridded = (
+            regridder(hurs_30_min, output_chunks=(-1, -1))["hurs"] * 0.01
+        )  # convert to fraction
+        assert (w5e5_regridded >= 0.1).all(), "too low values in relative humidity"
+        assert (w5e5_regridded <= 1).all(), "relative humidity > 1"
+
+        w5e5_regridded_tr = np.log(
+            w5e5_regridded / (1 - w5e5_regridded)
+        )  # assume beta distribuation => logit transform
+
+        # monthly means on the same month starts as the CHELSA time axis
+        w5e5_regridded_mean = w5e5_regridded.resample(time="MS").mean()
+        w5e5_regridded_mean_tr = np.log(
+            w5e5_regridded_mean / (1 - w5e5_regridded_mean)
+        )  # logit transform
+
+        chelsa = hurs_ds_30sec * 0.0001  # convert to fraction
+        assert (chelsa >= 0.1).all(), "too low values in relative humidity"
+        assert (chelsa <= 1).all(), "relative humidity > 1"
+
+        chelsa_tr = np.log(
+            chelsa / (1 - chelsa)
+        )  # assume beta distribuation => logit transform
+
+        difference = chelsa_tr - w5e5_regridded_mean_tr
+        # spread each monthly offset over the days of its month
+        difference = difference.reindex(time=w5e5_regridded.time, method="ffill")
+
+        # apply difference to w5e5
+        w5e5_regridded_tr_corr = w5e5_regridded_tr + difference
+        w5e5_regridded_corr = (
+            1 / (1 + np.exp(-w5e5_regridded_tr_corr))
+        ) * 100  # back transform
+        w5e5_regridded_corr.raster.set_crs(4326)
+        w5e5_regridded_corr_clipped = w5e5_regridded_corr.raster.clip_bbox(
+            hurs_output.raster.bounds
+        )
 
-                hurs_output.loc[dict(time=slice(start_month, end_month))] = (
-                    self.snap_to_grid(
-                        w5e5_regridded_corr_clipped, hurs_output, xdim="lon", ydim="lat"
-                    )
-                )
+        snapped = self.snap_to_grid(
+            w5e5_regridded_corr_clipped, hurs_output, xdim="lon", ydim="lat"
+        )
+        hurs_output.loc[dict(time=snapped.time)] = snapped
 
         hurs_output = hurs_output.rename({"lon": "x", "lat": "y"})
         self.set_forcing(hurs_output, "climate/hurs")
@@ -2735,15 +2998,6 @@ class GEBModel(GridModel):
 
         The resulting longwave radiation data is set as forcing data in the model with names of the form 'climate/rlds'.
         """
-        x1 = 0.43
-        x2 = 5.7
-        sbc = 5.67e-8  # stefan boltzman constant [Js−1 m−2 K−4]
-
-        es0 = 6.11  # reference saturation vapour pressure  [hPa]
-        T0 = 273.15
-        lv = 2.5e6  # latent heat of vaporization of water
-        Rv = 461.5  # gas constant for water vapour [J K kg-1]
-
         target = self.forcing["climate/hurs"].rename({"x": "lon", "y": "lat"})
 
         hurs_coarse = self.download_isimip(
@@ -2753,7 +3007,10 @@ class GEBModel(GridModel):
             endtime=endtime,
             forcing="w5e5v2.0",
             buffer=1,
-        ).hurs  # some buffer to avoid edge effects / errors in ISIMIP API
+        ).hurs.astype(
+            np.float32
+        )  # some buffer to avoid edge effects / errors in ISIMIP API
+        hurs_coarse = hurs_coarse.chunk({"time": 365, "lat": -1, "lon": -1})
         tas_coarse = self.download_isimip(
             product="SecondaryInputData",
             variable="tas",
@@ -2761,7 +3018,10 @@ class GEBModel(GridModel):
             endtime=endtime,
             forcing="w5e5v2.0",
             buffer=1,
-        ).tas  # some buffer to avoid edge effects / errors in ISIMIP API
+        ).tas.astype(
+            np.float32
+        )  # some buffer to avoid edge effects / errors in ISIMIP API
+        tas_coarse = tas_coarse.chunk({"time": 365, "lat": -1, "lon": -1})
         rlds_coarse = self.download_isimip(
             product="SecondaryInputData",
             variable="rlds",
@@ -2769,60 +3029,40 @@ class GEBModel(GridModel):
             endtime=endtime,
             forcing="w5e5v2.0",
             buffer=1,
-        ).rlds  # some buffer to avoid edge effects / errors in ISIMIP API
-
-        import xesmf as xe
+        ).rlds.astype(
+            np.float32
+        )  # some buffer to avoid edge effects / errors in ISIMIP API
+        rlds_coarse = rlds_coarse.chunk({"time": 365, "lat": -1, "lon": -1})
 
-        regridder = xe.Regridder(
-            hurs_coarse.isel(time=0).drop_vars("time"), target, "bilinear"
+        regridder = self._get_regridder(
+            hurs_coarse.isel(time=0).drop_vars("time"), target
         )
 
-        hurs_coarse_regridded = regridder(hurs_coarse, output_chunks=(-1, -1)).rename(
-            {"lon": "x", "lat": "y"}
-        )
-        tas_coarse_regridded = regridder(tas_coarse, output_chunks=(-1, -1)).rename(
-            {"lon": "x", "lat": "y"}
-        )
-        rlds_coarse_regridded = regridder(rlds_coarse, output_chunks=(-1, -1)).rename(
+        # regrid all three variables in one call so the source-mesh lookup is
+        # shared instead of repeated per variable
+        coarse = xr.merge([hurs_coarse, tas_coarse, rlds_coarse])
+        coarse_regridded = regridder(coarse, output_chunks=(-1, -1)).rename(
             {"lon": "x", "lat": "y"}
         )
+        hurs_coarse_regridded = coarse_regridded["hurs"]
+        tas_coarse_regridded = coarse_regridded["tas"]
+        rlds_coarse_regridded = coarse_regridded["rlds"]
 
         hurs_fine = self.forcing["climate/hurs"]
         tas_fine = self.forcing["climate/tas"]
 
-        # now ready for calculation:
-        es_coarse = es0 * np.exp(
-            (lv / Rv) * (1 / T0 - 1 / tas_coarse_regridded)
-        )  # saturation vapor pressure
-        pV_coarse = (
-            hurs_coarse_regridded * es_coarse
-        ) / 100  # water vapor pressure [hPa]
-
-        es_fine = es0 * np.exp((lv / Rv) * (1 / T0 - 1 / tas_fine))
-        pV_fine = (hurs_fine * es_fine) / 100  # water vapour pressure [hPa]
-
-        e_cl_coarse = 0.23 + x1 * ((pV_coarse * 100) / tas_coarse_regridded) ** (1 / x2)
-        # e_cl_coarse == clear-sky emissivity w5e5 (pV needs to be in Pa not hPa, hence *100)
-        e_cl_fine = 0.23 + x1 * ((pV_fine * 100) / tas_fine) ** (1 / x2)
-        # e_cl_fine == clear-sky emissivity target grid (pV needs to be in Pa not hPa, hence *100)
-
-        e_as_coarse = rlds_coarse_regridded / (
-            sbc * tas_coarse_regridded**4
-        )  # all-sky emissivity w5e5
-        e_as_coarse = xr.where(
-            e_as_coarse < 1, e_as_coarse, 1
-        )  # constrain all-sky emissivity to max 1
-        assert (e_as_coarse <= 1).all(), "all-sky emissivity should be <= 1"
-        delta_e = e_as_coarse - e_cl_coarse  # cloud-based component of emissivity w5e5
-
-        e_as_fine = e_cl_fine + delta_e
-        e_as_fine = xr.where(
-            e_as_fine < 1, e_as_fine, 1
-        )  # constrain all-sky emissivity to max 1
-        assert (e_as_fine <= 1).all(), "all-sky emissivity should be <= 1"
-        lw_fine = (
-            e_as_fine * sbc * tas_fine**4
-        )  # downscaled lwr! assume cloud e is the same
+        # the full emissivity chain is fused into one elementwise kernel; see
+        # workflows.general.downscale_longwave
+        lw_fine = xr.apply_ufunc(
+            downscale_longwave,
+            hurs_coarse_regridded,
+            tas_coarse_regridded,
+            rlds_coarse_regridded,
+            hurs_fine,
+            tas_fine,
+            dask="parallelized",
+            output_dtypes=[np.float32],
+        )
 
         lw_fine.name = "rlds"
         lw_fine = self.snap_to_grid(lw_fine, self.grid)
@@ -2860,39 +3100,46 @@ class GEBModel(GridModel):
         T0 = 288.16  # Sea level standard temperature  [K]
 
         target = self.forcing["climate/hurs"].rename({"x": "lon", "y": "lat"})
-        pressure_30_min = self.download_isimip(
-            product="SecondaryInputData",
-            variable="psl",
-            starttime=starttime,
-            endtime=endtime,
-            forcing="w5e5v2.0",
-            buffer=1,
-        ).psl  # some buffer to avoid edge effects / errors in ISIMIP API
+        # the two downloads are independent and network-bound, so overlap them
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            pressure_future = executor.submit(
+                self.download_isimip,
+                product="SecondaryInputData",
+                variable="psl",
+                starttime=starttime,
+                endtime=endtime,
+                forcing="w5e5v2.0",
+                buffer=1,  # some buffer to avoid edge effects / errors in ISIMIP API
+            )
+            orography_future = executor.submit(
+                self.download_isimip,
+                product="InputData",
+                variable="orog",
+                forcing="chelsa-w5e5",
+                buffer=1,  # some buffer to avoid edge effects / errors in ISIMIP API
+            )
+            pressure_30_min = pressure_future.result().psl.astype(np.float32)
+            orography = orography_future.result().orog.astype(np.float32)
 
-        orography = self.download_isimip(
-            product="InputData", variable="orog", forcing="chelsa-w5e5", buffer=1
-        ).orog  # some buffer to avoid edge effects / errors in ISIMIP API
-        import xesmf as xe
+        # chunk along time so the weight application parallelizes per chunk
+        # and memory stays bounded to one chunk of the cube
+        pressure_30_min = pressure_30_min.chunk({"time": 365, "lat": -1, "lon": -1})
 
-        regridder = xe.Regridder(orography, target, "bilinear")
+        regridder = self._get_regridder(orography, target)
         orography = regridder(orography, output_chunks=(-1, -1)).rename(
             {"lon": "x", "lat": "y"}
         )
 
-        regridder = xe.Regridder(
-            pressure_30_min.isel(time=0).drop_vars("time"), target, "bilinear"
+        regridder = self._get_regridder(
+            pressure_30_min.isel(time=0).drop_vars("time"), target
         )
         pressure_30_min_regridded = regridder(
             pressure_30_min, output_chunks=(-1, -1)
         ).rename({"lon": "x", "lat": "y"})
-        pressure_30_min_regridded_corr = pressure_30_min_regridded * np.exp(
-            -(g * orography * M) / (T0 * r0)
-        )
-
-        pressure = xr.full_like(self.forcing["climate/hurs"], fill_value=np.nan)
+        # lazy expression; no need for a preallocated NaN cube to assign into
+        pressure = pressure_30_min_regridded * np.exp(-(g * orography * M) / (T0 * r0))
         pressure.name = "ps"
         pressure.attrs = {"units": "Pa", "long_name": "surface pressure"}
-        pressure.data = pressure_30_min_regridded_corr
 
         pressure = self.snap_to_grid(pressure, self.grid)
         self.set_forcing(pressure, name="climate/ps")
@@ -2928,54 +3175,65 @@ class GEBModel(GridModel):
 
         The resulting wind data is set as forcing data in the model with names of the form 'climate/wind'.
         """
-        global_wind_atlas = self.data_catalog.get_rasterdataset(
-            "global_wind_atlas", bbox=self.grid.raster.bounds, buffer=10
-        ).rename({"x": "lon", "y": "lat"})
-        target = self.grid["areamaps/grid_mask"].rename({"x": "lon", "y": "lat"})
-        import xesmf as xe
-
-        regridder = xe.Regridder(global_wind_atlas.copy(), target, "bilinear")
-        global_wind_atlas_regridded = regridder(
-            global_wind_atlas, output_chunks=(-1, -1)
-        )
+        # the climatology and the daily series are independent downloads, so
+        # overlap them while the wind atlas is read from the catalog
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            wind_30_min_avg_future = executor.submit(
+                self.download_isimip,
+                product="SecondaryInputData",
+                variable="sfcwind",
+                starttime=date(2008, 1, 1),
+                endtime=date(2017, 12, 31),
+                forcing="w5e5v2.0",
+                buffer=1,  # some buffer to avoid edge effects / errors in ISIMIP API
+            )
+            wind_30_min_future = executor.submit(
+                self.download_isimip,
+                product="SecondaryInputData",
+                variable="sfcwind",
+                starttime=starttime,
+                endtime=endtime,
+                forcing="w5e5v2.0",
+                buffer=1,  # some buffer to avoid edge effects / errors in ISIMIP API
+            )
 
-        wind_30_min_avg = self.download_isimip(
-            product="SecondaryInputData",
-            variable="sfcwind",
-            starttime=date(2008, 1, 1),
-            endtime=date(2017, 12, 31),
-            forcing="w5e5v2.0",
-            buffer=1,
-        ).sfcWind.mean(
-            dim="time"
-        )  # some buffer to avoid edge effects / errors in ISIMIP API
-        regridder_30_min = xe.Regridder(wind_30_min_avg, target, "bilinear")
-        wind_30_min_avg_regridded = regridder_30_min(wind_30_min_avg)
+            global_wind_atlas = (
+                self.data_catalog.get_rasterdataset(
+                    "global_wind_atlas", bbox=self.grid.raster.bounds, buffer=10
+                )
+                .rename({"x": "lon", "y": "lat"})
+                .astype(np.float32)
+            )
+            target = self.grid["areamaps/grid_mask"].rename({"x": "lon", "y": "lat"})
 
-        # create diff layer:
-        # assume wind follows weibull distribution => do log transform
-        wind_30_min_avg_regridded_log = np.log(wind_30_min_avg_regridded)
+            regridder = self._get_regridder(global_wind_atlas.copy(), target)
+            global_wind_atlas_regridded = regridder(
+                global_wind_atlas, output_chunks=(-1, -1)
+            )
 
-        global_wind_atlas_regridded_log = np.log(global_wind_atlas_regridded)
+            wind_30_min_avg = (
+                wind_30_min_avg_future.result()
+                .sfcWind.astype(np.float32)
+                .mean(dim="time")
+            )
+            wind_30_min = wind_30_min_future.result().sfcWind.astype(np.float32)
 
-        diff_layer = (
-            global_wind_atlas_regridded_log - wind_30_min_avg_regridded_log
-        )  # to be added to log-transformed daily
+        regridder_30_min = self._get_regridder(wind_30_min_avg, target)
+        wind_30_min_avg_regridded = regridder_30_min(wind_30_min_avg)
 
-        wind_30_min = self.download_isimip(
-            product="SecondaryInputData",
-            variable="sfcwind",
-            starttime=starttime,
-            endtime=endtime,
-            forcing="w5e5v2.0",
-            buffer=1,
-        ).sfcWind  # some buffer to avoid edge effects / errors in ISIMIP API
+        # create correction layer:
+        # assume wind follows weibull distribution => the correction is a
+        # difference of log-transforms, i.e. exp(log(wind) + log(atlas) -
+        # log(avg)) == wind * atlas / avg, so compute the 2D ratio once and
+        # skip the log/exp round-trip over the full daily cube
+        correction_layer = global_wind_atlas_regridded / wind_30_min_avg_regridded
 
-        wind_30min_regridded = regridder_30_min(wind_30_min)
-        wind_30min_regridded_log = np.log(wind_30min_regridded)
+        # chunk along time so the weight application parallelizes per chunk
+        # and memory stays bounded to one chunk of the cube
+        wind_30_min = wind_30_min.chunk({"time": 365, "lat": -1, "lon": -1})
 
-        wind_30min_regridded_log_corr = wind_30min_regridded_log + diff_layer
-        wind_30min_regridded_corr = np.exp(wind_30min_regridded_log_corr)
+        wind_30min_regridded = regridder_30_min(wind_30_min, output_chunks=(-1, -1))
+        wind_30min_regridded_corr = wind_30min_regridded * correction_layer
 
         wind_output_clipped = wind_30min_regridded_corr.raster.clip_bbox(
             self.grid.raster.bounds
@@ -3041,14 +3299,19 @@ class GEBModel(GridModel):
                 f"while requested calibration period is from {calibration_period_start} to {calibration_period_end}"
             )
 
+        # chunk the inputs explicitly so the whole pipeline down to the zarr
+        # export stays dask-backed and peak memory is bounded per chunk
+        chunk_spec = {"time": 365, "x": XY_CHUNKSIZE, "y": XY_CHUNKSIZE}
         pet = xci.potential_evapotranspiration(
-            tasmin=self.forcing["climate/tasmin"],
-            tasmax=self.forcing["climate/tasmax"],
+            tasmin=self.forcing["climate/tasmin"].chunk(chunk_spec),
+            tasmax=self.forcing["climate/tasmax"].chunk(chunk_spec),
             method="BR65",
         )
 
         # Compute the potential evapotranspiration
-        water_budget = xci.water_budget(pr=self.forcing["climate/pr"], evspsblpot=pet)
+        water_budget = xci.water_budget(
+            pr=self.forcing["climate/pr"].chunk(chunk_spec), evspsblpot=pet
+        )
 
         water_budget.attrs = {"units": "kg m-2 s-1"}
 
@@ -3122,16 +3385,23 @@ class GEBModel(GridModel):
                 SPEI_yearly_max = inverted_SPEI.groupby("time.year").max(dim="time")
                 SPEI_yearly_max = (
                     SPEI_yearly_max.rename({"year": "time"})
-                    .chunk({"time": -1})
+                    .chunk({"time": -1, "y": "auto", "x": "auto"})
                     .compute()
                 )
 
-                GEV = xci.stats.fit(SPEI_yearly_max, dist="genextreme").compute()
-                GEV.name = "gev"
+                # closed-form probability-weighted-moment fit per pixel,
+                # parallelized with numba; see workflows.general.fit_gev.
+                # time goes last so every pixel's series is contiguous
+                gev_c, gev_loc, gev_scale = fit_gev(
+                    np.ascontiguousarray(
+                        SPEI_yearly_max.transpose("y", "x", "time").values
+                    )
+                )
 
-                self.set_grid(GEV.sel(dparams="c"), name="climate/gev_c")
-                self.set_grid(GEV.sel(dparams="loc"), name="climate/gev_loc")
-                self.set_grid(GEV.sel(dparams="scale"), name="climate/gev_scale")
+                template = SPEI_yearly_max.isel(time=0, drop=True)
+                self.set_grid(template.copy(data=gev_c), name="climate/gev_c")
+                self.set_grid(template.copy(data=gev_loc), name="climate/gev_loc")
+                self.set_grid(template.copy(data=gev_scale), name="climate/gev_scale")
 
     def setup_regions_and_land_use(
         self,
@@ -3233,10 +3503,26 @@ class GEBModel(GridModel):
             padded_subgrid, method="nearest"
         )
 
-        region_raster = reprojected_land_use.raster.rasterize(
-            self.geoms["areamaps/regions"],
-            col_name="region_id",
+        # call rasterio directly with prepared (geometry, id) tuples; the
+        # hydromt wrapper re-validates and re-projects the frame per call
+        region_raster = hydromt.raster.full(
+            reprojected_land_use.raster.coords,
+            nodata=-1,
+            dtype=np.int32,
+            name="areamaps/region_subgrid",
+            crs=reprojected_land_use.raster.crs,
+            lazy=True,
+        )
+        region_raster.data = rasterize(
+            zip(
+                self.geoms["areamaps/regions"].geometry.values,
+                self.geoms["areamaps/regions"]["region_id"].astype(np.int32).values,
+            ),
+            out_shape=region_raster.raster.shape,
+            transform=region_raster.raster.transform,
+            fill=-1,
             all_touched=True,
+            dtype=np.int32,
         )
         self.set_region_subgrid(region_raster, name="areamaps/region_subgrid")
 
@@ -3260,9 +3546,11 @@ class GEBModel(GridModel):
             lazy=False,
         )
 
-        # calculate the cell area for the subgrid for the entire region
-        region_cell_area_subgrid.data = (
-            repeat_grid(region_cell_area, self.subgrid_factor) / self.subgrid_factor**2
+        # calculate the cell area for the subgrid for the entire region;
+        # divide on the coarse grid first so the broadcasted subgrid is only
+        # written once
+        region_cell_area_subgrid.data = repeat_grid_view(
+            region_cell_area / self.subgrid_factor**2, self.subgrid_factor
         )
 
         # create new subgrid for the region without padding
@@ -3301,10 +3589,12 @@ class GEBModel(GridModel):
             y=MERIT.coords["y"] - MERIT.rio.resolution()[1] / 2,
         )
 
-        # Assume all cells with at least x upstream cells are rivers.
+        # Assume all cells with at least x upstream cells are rivers. A uint8
+        # mask pushes a quarter of the bytes of int32 through the
+        # memory-bound nearest-neighbour reprojection below.
         rivers = MERIT > river_threshold
-        rivers = rivers.astype(np.int32)
-        rivers.raster.set_nodata(-1)
+        rivers = rivers.astype(np.uint8)
+        rivers.raster.set_nodata(255)
         rivers = rivers.raster.reproject_like(reprojected_land_use, method="nearest")
         self.set_region_subgrid(rivers, name="landcover/rivers")
 
@@ -3348,19 +3638,19 @@ class GEBModel(GridModel):
             cultivated_land, name="landsurface/full_region_cultivated_land"
         )
 
-        hydro_land_use_region = hydro_land_use.isel(region_subgrid_slice)
-
-        # TODO: Doesn't work when using the original array. Somehow the dtype is changed on adding it to the subgrid. This is a workaround.
-        self.set_subgrid(
-            hydro_land_use_region.values, name="landsurface/land_use_classes"
+        # assign the subgrid's own coordinates to the sliced arrays, so that
+        # inserting them into the subgrid dataset aligns exactly instead of
+        # reindexing on near-identical floats, which upcast the dtype and
+        # previously forced a workaround through raw .values copies
+        hydro_land_use_region = hydro_land_use.isel(region_subgrid_slice).assign_coords(
+            x=self.subgrid.coords["x"], y=self.subgrid.coords["y"]
         )
+        self.set_subgrid(hydro_land_use_region, name="landsurface/land_use_classes")
 
-        cultivated_land_region = cultivated_land.isel(region_subgrid_slice)
-
-        # Same workaround as above
-        self.set_subgrid(
-            cultivated_land_region.values, name="landsurface/cultivated_land"
-        )
+        cultivated_land_region = cultivated_land.isel(
+            region_subgrid_slice
+        ).assign_coords(x=self.subgrid.coords["x"], y=self.subgrid.coords["y"])
+        self.set_subgrid(cultivated_land_region, name="landsurface/cultivated_land")
 
     def setup_economic_data(
         self, project_future_until_year=False, reference_start_year=2000
@@ -3514,6 +3804,53 @@ class GEBModel(GridModel):
     def setup_irrigation_sources(self, irrigation_sources):
         self.set_dict(irrigation_sources, name="agents/farmers/irrigation_sources")
 
+    def _propagate_price_by_inflation(
+        self,
+        reference_price,
+        reference_year,
+        start_year,
+        end_year,
+        rates,
+        year_to_index,
+    ):
+        """Propagate a reference-year price over [start_year, end_year] using
+        yearly inflation rates.
+
+        Years after the reference year multiply by the cumulative product of
+        the inflation rates, earlier years divide by the cumulative product
+        going back, so the whole series is two ``np.cumprod`` calls instead of
+        a year-by-year Python loop with a linear scan of the time axis per
+        year. Returns the prices as a list, ordered from start to end year.
+        """
+        reference_price = float(np.squeeze(reference_price))
+        rates = np.asarray(rates, dtype=np.float64)
+        backward_rates = (
+            rates[
+                year_to_index[str(start_year + 1)] : year_to_index[str(reference_year)]
+                + 1
+            ]
+            if reference_year > start_year
+            else rates[:0]
+        )
+        assert backward_rates.size == reference_year - start_year
+        forward_rates = (
+            rates[
+                year_to_index[str(reference_year + 1)] : year_to_index[str(end_year)]
+                + 1
+            ]
+            if end_year > reference_year
+            else rates[:0]
+        )
+        assert forward_rates.size == end_year - reference_year
+        prices = np.concatenate(
+            [
+                reference_price / np.cumprod(backward_rates[::-1])[::-1],
+                [reference_price],
+                reference_price * np.cumprod(forward_rates),
+            ]
+        )
+        return prices.tolist()
+
     def setup_well_prices_by_reference_year(
         self,
         irrigation_maintenance: float,
@@ -3569,32 +3906,21 @@ class GEBModel(GridModel):
             "electricity_cost": electricity_cost,
         }
 
+        year_to_index = {year: i for i, year in enumerate(inflation_rates["time"])}
+
         # Iterate over each price type and calculate the prices across years for each region
         for price_type, initial_price in price_types.items():
             prices_dict = {"time": list(range(start_year, end_year + 1)), "data": {}}
 
             for region in regions:
-                prices = pd.Series(index=range(start_year, end_year + 1))
-                prices.loc[reference_year] = initial_price
-
-                # Forward calculation from the reference year
-                for year in range(reference_year + 1, end_year + 1):
-                    prices.loc[year] = (
-                        prices[year - 1]
-                        * inflation_rates["data"][region][
-                            inflation_rates["time"].index(str(year))
-                        ]
-                    )
-                # Backward calculation from the reference year
-                for year in range(reference_year - 1, start_year - 1, -1):
-                    prices.loc[year] = (
-                        prices[year + 1]
-                        / inflation_rates["data"][region][
-                            inflation_rates["time"].index(str(year + 1))
-                        ]
-                    )
-
-                prices_dict["data"][region] = prices.tolist()
+                prices_dict["data"][region] = self._propagate_price_by_inflation(
+                    initial_price,
+                    reference_year,
+                    start_year,
+                    end_year,
+                    inflation_rates["data"][region],
+                    year_to_index,
+                )
 
             # Set the calculated prices in the appropriate dictionary
             self.set_dict(prices_dict, name=f"economics/{price_type}")
@@ -3661,6 +3987,8 @@ class GEBModel(GridModel):
             "electricity_cost": electricity_rates,
         }
 
+        year_to_index = {year: i for i, year in enumerate(inflation_rates["time"])}
+
         # Iterate over each price type and calculate the prices across years for each region
         for price_type, initial_price in price_types.items():
             prices_dict = {"time": list(range(start_year, end_year + 1)), "data": {}}
@@ -3669,8 +3997,6 @@ class GEBModel(GridModel):
                 region_name = region["NAME_0"]
                 region_id = str(region["region_id"])
 
-                prices = pd.Series(index=range(start_year, end_year + 1))
-
                 if price_type == "electricity_cost":
                     country_price = initial_price.loc[
                         initial_price["Country"] == region_name, "Rate"
@@ -3681,7 +4007,7 @@ class GEBModel(GridModel):
                     )[years_index_lcu]
 
                     # Conversion is same as with ppp
-                    prices.loc[reference_year] = self.convert_price_using_ppp(
+                    reference_price = self.convert_price_using_ppp(
                         country_price,
                         source_conversion_rates,
                         target_conversion_rates,
@@ -3692,30 +4018,20 @@ class GEBModel(GridModel):
                         ppp_conversion_rates["data"][region_id], dtype=float
                     )[years_index_ppp]
 
-                    prices.loc[reference_year] = self.convert_price_using_ppp(
+                    reference_price = self.convert_price_using_ppp(
                         initial_price,
                         source_conversion_rates,
                         target_conversion_rates,
                     )
 
-                # Forward calculation from the reference year
-                for year in range(reference_year + 1, end_year + 1):
-                    prices.loc[year] = (
-                        prices[year - 1]
-                        * inflation_rates["data"][region_id][
-                            inflation_rates["time"].index(str(year))
-                        ]
-                    )
-                # Backward calculation from the reference year
-                for year in range(reference_year - 1, start_year - 1, -1):
-                    prices.loc[year] = (
-                        prices[year + 1]
-                        / inflation_rates["data"][region_id][
-                            inflation_rates["time"].index(str(year + 1))
-                        ]
-                    )
-
-                prices_dict["data"][region_id] = prices.tolist()
+                prices_dict["data"][region_id] = self._propagate_price_by_inflation(
+                    reference_price,
+                    reference_year,
+                    start_year,
+                    end_year,
+                    inflation_rates["data"][region_id],
+                    year_to_index,
+                )
 
             # Set the calculated prices in the appropriate dictionary
             self.set_dict(prices_dict, name=f"economics/{price_type}")
@@ -3762,32 +4078,23 @@ class GEBModel(GridModel):
         inflation_rates = self.dict["economics/inflation_rates"]
         regions = list(inflation_rates["data"].keys())
 
+        year_to_index = {year: i for i, year in enumerate(inflation_rates["time"])}
+
         drip_irrigation_prices_dict = {
             "time": list(range(start_year, end_year + 1)),
             "data": {},
         }
         for region in regions:
-            drip_irrigation_prices = pd.Series(index=range(start_year, end_year + 1))
-            drip_irrigation_prices.loc[reference_year] = drip_irrigation_price
-
-            for year in range(reference_year + 1, end_year + 1):
-                drip_irrigation_prices.loc[year] = (
-                    drip_irrigation_prices[year - 1]
-                    * inflation_rates["data"][region][
-                        inflation_rates["time"].index(str(year))
-                    ]
-                )
-            for year in range(reference_year - 1, start_year - 1, -1):
-                drip_irrigation_prices.loc[year] = (
-                    drip_irrigation_prices[year + 1]
-                    / inflation_rates["data"][region][
-                        inflation_rates["time"].index(str(year + 1))
-                    ]
+            drip_irrigation_prices_dict["data"][region] = (
+                self._propagate_price_by_inflation(
+                    drip_irrigation_price,
+                    reference_year,
+                    start_year,
+                    end_year,
+                    inflation_rates["data"][region],
+                    year_to_index,
                 )
-
-            drip_irrigation_prices_dict["data"][
-                region
-            ] = drip_irrigation_prices.tolist()
+            )
 
         self.set_dict(
             drip_irrigation_prices_dict, name="economics/drip_irrigation_prices"
@@ -3795,25 +4102,14 @@ class GEBModel(GridModel):
 
         upkeep_prices_dict = {"time": list(range(start_year, end_year + 1)), "data": {}}
         for region in regions:
-            upkeep_prices = pd.Series(index=range(start_year, end_year + 1))
-            upkeep_prices.loc[reference_year] = upkeep_price_per_m2
-
-            for year in range(reference_year + 1, end_year + 1):
-                upkeep_prices.loc[year] = (
-                    upkeep_prices[year - 1]
-                    * inflation_rates["data"][region][
-                        inflation_rates["time"].index(str(year))
-                    ]
-                )
-            for year in range(reference_year - 1, start_year - 1, -1):
-                upkeep_prices.loc[year] = (
-                    upkeep_prices[year + 1]
-                    / inflation_rates["data"][region][
-                        inflation_rates["time"].index(str(year + 1))
-                    ]
-                )
-
-            upkeep_prices_dict["data"][region] = upkeep_prices.tolist()
+            upkeep_prices_dict["data"][region] = self._propagate_price_by_inflation(
+                upkeep_price_per_m2,
+                reference_year,
+                start_year,
+                end_year,
+                inflation_rates["data"][region],
+                year_to_index,
+            )
 
         self.set_dict(
             upkeep_prices_dict, name="economics/upkeep_prices_drip_irrigation_per_m2"
@@ -3861,14 +4157,27 @@ class GEBModel(GridModel):
             "landsurface/full_region_cultivated_land"
         ].compute()
 
-        farms = hydromt.raster.full_like(regions_raster, nodata=-1, lazy=True)
-        farms[:] = -1
-        assert farms.min() >= -1  # -1 is nodata value, all farms should be positive
+        regions_raster_array = np.asarray(regions_raster.values)
+        farms_array = np.full(regions_raster_array.shape, -1, dtype=np.int32)
+
+        # bounding box of every region in one labelled pass instead of a
+        # full-raster boolean scan per region (labels are shifted by one
+        # because find_objects ignores label 0, i.e. the -1 nodata cells)
+        region_bounding_boxes = find_objects(regions_raster_array + 1)
 
         for region_id in regions["region_id"]:
             self.logger.info(f"Creating farms for region {region_id}")
-            region = regions_raster == region_id
-            region_clip, bounds = clip_with_grid(region, region)
+            # region without any cells in the raster, including ids beyond
+            # the highest labelled one
+            if (
+                region_id >= len(region_bounding_boxes)
+                or region_bounding_boxes[region_id] is None
+            ):
+                assert (farmers["region_id"] == region_id).sum() == 0
+                continue
+            bounding_box = region_bounding_boxes[region_id]
+            bounds = {"y": bounding_box[0], "x": bounding_box[1]}
+            region_clip = regions_raster_array[bounding_box] == region_id
 
             cultivated_land_region = full_region_cultivated_land.isel(bounds)
             cultivated_land_region = xr.where(
@@ -3884,45 +4193,57 @@ class GEBModel(GridModel):
             assert (
                 farms_region.min() >= -1
             )  # -1 is nodata value, all farms should be positive
-            farms[bounds] = xr.where(
-                region_clip, farms_region, farms.isel(bounds), keep_attrs=True
+            # scatter back into the preallocated array under the region mask
+            farms_array[bounding_box] = np.where(
+                region_clip, farms_region, farms_array[bounding_box]
             )
-            farms = farms.compute()  # perhaps this helps with memory issues?
+
+        farms = hydromt.raster.full_like(regions_raster, nodata=-1, lazy=True)
+        farms.data = farms_array
+        assert farms.min() >= -1  # -1 is nodata value, all farms should be positive
 
         farmers = farmers.drop("area_n_cells", axis=1)
 
         region_mask = self.region_subgrid["areamaps/region_mask"].astype(bool)
 
-        # TODO: Again why is dtype changed? And export doesn't work?
-        cut_farms = np.unique(
-            xr.where(region_mask, farms.copy().values, -1, keep_attrs=True)
-        )
-        cut_farms = cut_farms[cut_farms != -1]
+        # mark the farm ids seen under the mask in a lookup table rather than
+        # sorting the masked raster with np.unique; the spare last slot
+        # absorbs the -1 nodata cells and is cleared before collecting
+        seen_farms = np.zeros(farmers.index.max() + 2, dtype=bool)
+        seen_farms[farms.values[region_mask.values]] = True
+        seen_farms[-1] = False
+        cut_farms = np.flatnonzero(seen_farms)
 
         assert farms.min() >= -1  # -1 is nodata value, all farms should be positive
         subgrid_farms = farms.raster.clip_bbox(
             self.subgrid["areamaps/sub_grid_mask"].raster.bounds
         )
 
-        subgrid_farms_in_study_area = xr.where(
-            np.isin(subgrid_farms, cut_farms), -1, subgrid_farms, keep_attrs=True
-        )
-        farmers = farmers[~farmers.index.isin(cut_farms)]
-
-        remap_farmer_ids = np.full(
-            farmers.index.max() + 2, -1, dtype=np.int32
-        )  # +1 because 0 is also a farm, +1 because no farm is -1, set to -1 in next step
+        # a single int32 lookup table fuses the cut-farm masking with the id
+        # remap: cut farms keep the initial -1 and the -1 nodata cells wrap
+        # to the never-set last slot, so one gather over the subgrid yields
+        # the final raster
+        cut_farms_lut = np.zeros(farmers.index.max() + 2, dtype=bool)
+        cut_farms_lut[cut_farms] = True
+        remap_farmer_ids = np.full(farmers.index.max() + 2, -1, dtype=np.int32)
+        # the lookup table already encodes membership, so reuse it rather
+        # than building a hash set with Index.isin
+        farmers = farmers[~cut_farms_lut[farmers.index.values]]
         remap_farmer_ids[farmers.index] = np.arange(len(farmers))
-        subgrid_farms_in_study_area = remap_farmer_ids[
-            subgrid_farms_in_study_area.values
-        ]
+        subgrid_farms_in_study_area = remap_farmer_ids[subgrid_farms.values]
 
         farmers = farmers.reset_index(drop=True)
 
-        assert np.setdiff1d(np.unique(subgrid_farms_in_study_area), -1).size == len(
-            farmers
-        )
-        assert farmers.iloc[-1].name == subgrid_farms_in_study_area.max()
+        if __debug__:
+            # every remapped farmer must own at least one subgrid cell; a
+            # boolean scatter checks this in one pass instead of sorting
+            # the raster with unique/setdiff1d, and the scatter itself
+            # fails if an id falls outside the remapped range
+            farmer_has_cells = np.zeros(len(farmers), dtype=bool)
+            farmer_has_cells[
+                subgrid_farms_in_study_area[subgrid_farms_in_study_area != -1]
+            ] = True
+            assert farmer_has_cells.all()
 
         self.set_subgrid(subgrid_farms_in_study_area, name="agents/farmers/farms")
         self.subgrid["agents/farmers/farms"].rio.set_nodata(-1)
@@ -4018,6 +4339,19 @@ class GEBModel(GridModel):
         regions_grid = self.region_subgrid["areamaps/region_subgrid"].compute()
         cell_area = self.region_subgrid["areamaps/region_cell_area_subgrid"].compute()
 
+        # plain numpy views, so the per-region reductions below run without
+        # rebuilding xarray objects or dask scalars in every iteration
+        cultivated_land_array = np.asarray(cultivated_land.values)
+        regions_grid_array = np.asarray(regions_grid.values)
+        cell_area_array = np.asarray(cell_area.values)
+
+        # bounding box per region id (shifted by one because label 0 is
+        # ignored and -1 is the nodata value), so each iteration of the
+        # regions loop scans only its own window rather than the full grid
+        region_bounding_boxes = find_objects(regions_grid_array + 1)
+
+        rng = np.random.default_rng()
+
         regions_shapes = self.geoms["areamaps/regions"]
         if data_source == "lowder":
             assert (
@@ -4039,125 +4373,20 @@ class GEBModel(GridModel):
             ].ffill()
 
             # convert country names to ISO3 codes
-            iso3_codes = {
-                "Albania": "ALB",
-                "Algeria": "DZA",
-                "American Samoa": "ASM",
-                "Argentina": "ARG",
-                "Austria": "AUT",
-                "Bahamas": "BHS",
-                "Barbados": "BRB",
-                "Belgium": "BEL",
-                "Brazil": "BRA",
-                "Bulgaria": "BGR",
-                "Burkina Faso": "BFA",
-                "Chile": "CHL",
-                "Colombia": "COL",
-                "Côte d'Ivoire": "CIV",
-                "Croatia": "HRV",
-                "Cyprus": "CYP",
-                "Czech Republic": "CZE",
-                "Democratic Republic of the Congo": "COD",
-                "Denmark": "DNK",
-                "Dominica": "DMA",
-                "Ecuador": "ECU",
-                "Egypt": "EGY",
-                "Estonia": "EST",
-                "Ethiopia": "ETH",
-                "Fiji": "FJI",
-                "Finland": "FIN",
-                "France": "FRA",
-                "French Polynesia": "PYF",
-                "Georgia": "GEO",
-                "Germany": "DEU",
-                "Greece": "GRC",
-                "Grenada": "GRD",
-                "Guam": "GUM",
-                "Guatemala": "GTM",
-                "Guinea": "GIN",
-                "Honduras": "HND",
-                "India": "IND",
-                "Indonesia": "IDN",
-                "Iran (Islamic Republic of)": "IRN",
-                "Ireland": "IRL",
-                "Italy": "ITA",
-                "Japan": "JPN",
-                "Jamaica": "JAM",
-                "Jordan": "JOR",
-                "Korea, Rep. of": "KOR",
-                "Kyrgyzstan": "KGZ",
-                "Lao People's Democratic Republic": "LAO",
-                "Latvia": "LVA",
-                "Lebanon": "LBN",
-                "Lithuania": "LTU",
-                "Luxembourg": "LUX",
-                "Malta": "MLT",
-                "Morocco": "MAR",
-                "Myanmar": "MMR",
-                "Namibia": "NAM",
-                "Nepal": "NPL",
-                "Netherlands": "NLD",
-                "Nicaragua": "NIC",
-                "Northern Mariana Islands": "MNP",
-                "Norway": "NOR",
-                "Pakistan": "PAK",
-                "Panama": "PAN",
-                "Paraguay": "PRY",
-                "Peru": "PER",
-                "Philippines": "PHL",
-                "Poland": "POL",
-                "Portugal": "PRT",
-                "Puerto Rico": "PRI",
-                "Qatar": "QAT",
-                "Romania": "ROU",
-                "Saint Lucia": "LCA",
-                "Saint Vincent and the Grenadines": "VCT",
-                "Samoa": "WSM",
-                "Senegal": "SEN",
-                "Serbia": "SRB",
-                "Sweden": "SWE",
-                "Switzerland": "CHE",
-                "Thailand": "THA",
-                "Trinidad and Tobago": "TTO",
-                "Turkey": "TUR",
-                "Uganda": "UGA",
-                "United Kingdom": "GBR",
-                "United States of America": "USA",
-                "Uruguay": "URY",
-                "Venezuela (Bolivarian Republic of)": "VEN",
-                "Virgin Islands, United States": "VIR",
-                "Yemen": "YEM",
-                "Cook Islands": "COK",
-                "French Guiana": "GUF",
-                "Guadeloupe": "GLP",
-                "Martinique": "MTQ",
-                "Réunion": "REU",
-                "Canada": "CAN",
-                "China": "CHN",
-                "Guinea Bissau": "GNB",
-                "Hungary": "HUN",
-                "Lesotho": "LSO",
-                "Libya": "LBY",
-                "Malawi": "MWI",
-                "Mozambique": "MOZ",
-                "New Zealand": "NZL",
-                "Slovakia": "SVK",
-                "Slovenia": "SVN",
-                "Spain": "ESP",
-                "St. Kitts & Nevis": "KNA",
-                "Viet Nam": "VNM",
-                "Australia": "AUS",
-                "Djibouti": "DJI",
-                "Mali": "MLI",
-                "Togo": "TGO",
-                "Zambia": "ZMB",
-            }
             farm_sizes_per_region["ISO3"] = farm_sizes_per_region["Country"].map(
-                iso3_codes
+                ISO3_CODES
             )
             assert (
                 not farm_sizes_per_region["ISO3"].isna().any()
             ), f"Found {farm_sizes_per_region['ISO3'].isna().sum()} countries without ISO3 code"
+
+            # slice the Lowder table per country once, so the regions loop
+            # below fetches each country's two rows with a dict lookup
+            # instead of a full-table boolean scan
+            farm_sizes_by_country = {
+                iso3: rows.drop(["Country", "Census Year", "Total"], axis=1)
+                for iso3, rows in farm_sizes_per_region.groupby("ISO3", sort=False)
+            }
         else:
             # load data source
             farm_sizes_per_region = pd.read_excel(
@@ -4187,29 +4416,33 @@ class GEBModel(GridModel):
 
             self.logger.debug(f"Processing region {UID}")
 
-            cultivated_land_region_total_cells = (
-                ((regions_grid == UID) & (cultivated_land)).sum().compute()
-            )
-            total_cultivated_land_area_lu = (
-                (((regions_grid == UID) & (cultivated_land)) * cell_area)
-                .sum()
-                .compute()
-            )
+            # regions without any cells in the raster have no farmers
+            if UID >= len(region_bounding_boxes) or region_bounding_boxes[UID] is None:
+                continue
+            bounding_box = region_bounding_boxes[UID]
+
+            # build the region mask once within the bounding box and reuse
+            # it for the cell count, the total area and the mean cell area
+            cultivated_land_region_mask = (
+                regions_grid_array[bounding_box] == UID
+            ) & cultivated_land_array[bounding_box]
+            cultivated_land_region_total_cells = int(cultivated_land_region_mask.sum())
+            region_cell_areas = cell_area_array[bounding_box][
+                cultivated_land_region_mask
+            ]
+            total_cultivated_land_area_lu = region_cell_areas.sum()
             if (
                 total_cultivated_land_area_lu == 0
             ):  # when no agricultural area, just continue as there will be no farmers. Also avoiding some division by 0 errors.
                 continue
 
-            average_cell_area_region = (
-                cell_area.where(((regions_grid == UID) & (cultivated_land)))
-                .mean()
-                .compute()
-            )
+            average_cell_area_region = region_cell_areas.mean()
 
             if data_source == "lowder":
-                region_farm_sizes = farm_sizes_per_region.loc[
-                    (farm_sizes_per_region["ISO3"] == country_ISO3)
-                ].drop(["Country", "Census Year", "Total"], axis=1)
+                assert (
+                    country_ISO3 in farm_sizes_by_country
+                ), f"No farm sizes found for {country_ISO3}"
+                region_farm_sizes = farm_sizes_by_country[country_ISO3]
                 assert (
                     len(region_farm_sizes) == 2
                 ), f"Found {len(region_farm_sizes) / 2} region_farm_sizes for {country_ISO3}"
@@ -4268,16 +4501,14 @@ class GEBModel(GridModel):
             n_missing_cells = cultivated_land_region_total_cells - whole_cells
             assert n_missing_cells <= len(agricultural_area_db)
 
-            index = list(
-                zip(
-                    leftover_cells_per_size_class.index,
-                    leftover_cells_per_size_class % 1,
-                )
-            )
-            n_cells_to_add = sorted(index, key=lambda x: x[1], reverse=True)[
-                : n_missing_cells.compute().item()
-            ]
-            whole_cells_per_size_class.loc[[p[0] for p in n_cells_to_add]] += 1
+            # top up the size classes with the largest leftover fractions,
+            # selected with an O(N) argpartition instead of sorting
+            # (label, leftover) tuples in Python
+            if n_missing_cells > 0:
+                n_cells_to_add = np.argpartition(
+                    -leftover_cells_per_size_class.values, n_missing_cells - 1
+                )[:n_missing_cells]
+                whole_cells_per_size_class.iloc[n_cells_to_add] += 1
 
             region_agents = []
             for size_class in whole_cells_per_size_class.index:
@@ -4285,9 +4516,7 @@ class GEBModel(GridModel):
                 if whole_cells_per_size_class.loc[size_class] == 0:
                     continue
 
-                number_of_agents_size_class = round(
-                    region_n_holdings[size_class].compute().item()
-                )
+                number_of_agents_size_class = round(region_n_holdings[size_class])
                 # if there is agricultural land, but there are no agents rounded down, we assume there is one agent
                 if (
                     number_of_agents_size_class == 0
@@ -4351,9 +4580,9 @@ class GEBModel(GridModel):
                 assert (
                     n_farms_size_class * farm_sizes_size_class
                 ).sum() == whole_cells_per_size_class[size_class]
-                farm_sizes = farm_sizes_size_class.repeat(n_farms_size_class)
-                np.random.shuffle(farm_sizes)
-                population["area_n_cells"] = farm_sizes
+                population["area_n_cells"] = rng.permutation(
+                    farm_sizes_size_class.repeat(n_farms_size_class)
+                )
                 region_agents.append(population)
 
                 assert (
@@ -4673,16 +4902,22 @@ class GEBModel(GridModel):
             )
         self.set_binary(irrigation_source, name="agents/farmers/irrigation_source")
 
-        household_size = random.choices([1, 2, 3, 4, 5, 6, 7], k=n_farmers)
+        # sample in one numpy call per attribute instead of a Python-level
+        # loop per farmer
+        household_size = np.random.choice([1, 2, 3, 4, 5, 6, 7], size=n_farmers)
         self.set_binary(household_size, name="agents/farmers/household_size")
 
-        daily_non_farm_income_family = random.choices([50, 100, 200, 500], k=n_farmers)
+        daily_non_farm_income_family = np.random.choice(
+            [50, 100, 200, 500], size=n_farmers
+        )
         self.set_binary(
             daily_non_farm_income_family,
             name="agents/farmers/daily_non_farm_income_family",
         )
 
-        daily_consumption_per_capita = random.choices([50, 100, 200, 500], k=n_farmers)
+        daily_consumption_per_capita = np.random.choice(
+            [50, 100, 200, 500], size=n_farmers
+        )
         self.set_binary(
             daily_consumption_per_capita,
             name="agents/farmers/daily_consumption_per_capita",
@@ -4790,13 +5025,54 @@ class GEBModel(GridModel):
             features = pd.concat(all_features[feature_type], ignore_index=True)
             self.set_geoms(features, name=f"assets/{feature_type}")
 
+    def _get_regridder(self, src, dst, method="bilinear"):
+        """Build an xESMF regridder, reusing weights where possible.
+
+        The weight matrix only depends on the source and destination grids
+        and the method, so regridders are memoized on the model and their
+        weights persisted under preprocessing/regridders, from where they are
+        read back on re-runs instead of being recomputed.
+        """
+        import xesmf as xe
+
+        def grid_key(ds):
+            lat = np.asarray(ds["lat"] if "lat" in ds.coords else ds["y"])
+            lon = np.asarray(ds["lon"] if "lon" in ds.coords else ds["x"])
+            return (
+                lat.size,
+                lon.size,
+                float(lat[0]),
+                float(lat[-1]),
+                float(lon[0]),
+                float(lon[-1]),
+            )
+
+        key = (grid_key(src), grid_key(dst), method)
+        if key not in self._regridder_cache:
+            weights_folder = Path(self.root).parent / "preprocessing" / "regridders"
+            weights_folder.mkdir(parents=True, exist_ok=True)
+            digest = hashlib.md5(repr(key).encode()).hexdigest()[:16]
+            weights_fn = weights_folder / f"{method}_{digest}.nc"
+            self._regridder_cache[key] = xe.Regridder(
+                src,
+                dst,
+                method,
+                filename=str(weights_fn),
+                reuse_weights=weights_fn.exists(),
+            )
+        return self._regridder_cache[key]
+
     def interpolate(self, ds, interpolation_method, ydim="y", xdim="x"):
-        out_ds = ds.interp(
-            method=interpolation_method,
-            **{
+        # the destination grid is identical for every call, so build the
+        # (possibly renamed) target coordinates only once per dimension naming
+        if (ydim, xdim) not in self._interpolation_target_cache:
+            self._interpolation_target_cache[(ydim, xdim)] = {
                 ydim: self.grid.y.rename({"y": ydim}),
                 xdim: self.grid.x.rename({"x": xdim}),
-            },
+            }
+        out_ds = ds.interp(
+            method=interpolation_method,
+            **self._interpolation_target_cache[(ydim, xdim)],
         )
         assert len(ds.dims) == len(out_ds.dims)
         return out_ds
@@ -4851,6 +5127,23 @@ class GEBModel(GridModel):
         # if starttime is specified, endtime must be specified as well
         assert (starttime is None) == (endtime is None)
 
+        # several setup methods request the exact same dataset (e.g. coarse
+        # hurs is used both for the humidity and the longwave downscaling), so
+        # memoize the opened lazy dataset per argument combination
+        cache_key = (
+            product,
+            variable,
+            forcing,
+            starttime,
+            endtime,
+            simulation_round,
+            climate_scenario,
+            resolution,
+            buffer,
+        )
+        if cache_key in self._isimip_cache:
+            return self._isimip_cache[cache_key]
+
         client = ISIMIPClient()
         download_path = (
             Path(self.root).parent / "preprocessing" / "climate" / forcing / variable
@@ -4967,50 +5260,71 @@ class GEBModel(GridModel):
             )
             # make sure the file exists
             assert zip_file.exists()
-            # Open the zip file
+            # Get a list of all the files in the zip file
             with zipfile.ZipFile(zip_file, "r") as zip_ref:
-                # Get a list of all the files in the zip file
                 file_list = [f for f in zip_ref.namelist() if f.endswith(".nc")]
-                # Extract each file one by one
-                for i, file_name in enumerate(file_list):
-                    # Rename the file
-                    bounds_str = ""
-                    if isinstance(ymin, float):
-                        bounds_str += f"_lat{ymin}"
-                    else:
-                        bounds_str += f"_lat{ymin:.1f}"
-                    if isinstance(ymax, float):
-                        bounds_str += f"to{ymax}"
-                    else:
-                        bounds_str += f"to{ymax:.1f}"
-                    if isinstance(xmin, float):
-                        bounds_str += f"lon{xmin}"
-                    else:
-                        bounds_str += f"lon{xmin:.1f}"
-                    if isinstance(xmax, float):
-                        bounds_str += f"to{xmax}"
-                    else:
-                        bounds_str += f"to{xmax:.1f}"
-                    assert bounds_str in file_name
-                    new_file_name = file_name.replace(bounds_str, "")
-                    zip_ref.getinfo(file_name).filename = new_file_name
-                    # Extract the file
-                    if os.name == "nt":
-                        max_file_path_length = 260
-                    else:
-                        max_file_path_length = os.pathconf("/", "PC_PATH_MAX")
-                    assert (
-                        len(str(download_path / new_file_name)) <= max_file_path_length
-                    ), f"File path too long: {download_path / zip_ref.getinfo(file_name).filename}"
-                    zip_ref.extract(file_name, path=download_path)
+
+            bounds_str = ""
+            if isinstance(ymin, float):
+                bounds_str += f"_lat{ymin}"
+            else:
+                bounds_str += f"_lat{ymin:.1f}"
+            if isinstance(ymax, float):
+                bounds_str += f"to{ymax}"
+            else:
+                bounds_str += f"to{ymax:.1f}"
+            if isinstance(xmin, float):
+                bounds_str += f"lon{xmin}"
+            else:
+                bounds_str += f"lon{xmin:.1f}"
+            if isinstance(xmax, float):
+                bounds_str += f"to{xmax}"
+            else:
+                bounds_str += f"to{xmax:.1f}"
+
+            if os.name == "nt":
+                max_file_path_length = 260
+            else:
+                max_file_path_length = os.pathconf("/", "PC_PATH_MAX")
+
+            def extract_member(file_name):
+                # extract under the renamed path directly instead of
+                # mutating the zip member's filename first
+                assert bounds_str in file_name
+                target = download_path / file_name.replace(bounds_str, "")
+                assert (
+                    len(str(target)) <= max_file_path_length
+                ), f"File path too long: {target}"
+                # each worker opens its own handle, otherwise all reads
+                # serialize on the shared ZipFile lock
+                with zipfile.ZipFile(zip_file, "r") as zip_ref:
+                    with zip_ref.open(file_name) as source:
+                        with open(target, "wb") as destination:
+                            shutil.copyfileobj(source, destination, 1024 * 1024)
+
+            # extract the NetCDF members concurrently, streaming each one
+            # to its destination so decompression overlaps with disk writes
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(len(file_list), 8)
+            ) as executor:
+                list(executor.map(extract_member, file_list))
             # remove zip file
             (
                 download_path / Path(urlparse(response["file_url"]).path.split("/")[-1])
             ).unlink()
 
-        datasets = [
-            xr.open_dataset(download_path / file, chunks={}) for file in parse_files
-        ]
+        # open the NetCDF headers concurrently; the files keep their slightly
+        # offset coordinates, so alignment stays explicit below rather than
+        # being delegated to open_mfdataset's by-coords combine
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(len(parse_files), 8)
+        ) as executor:
+            datasets = list(
+                executor.map(
+                    lambda file: xr.open_dataset(download_path / file, chunks={}),
+                    parse_files,
+                )
+            )
         for dataset in datasets:
             assert "lat" in dataset.coords and "lon" in dataset.coords
 
@@ -5079,6 +5393,7 @@ class GEBModel(GridModel):
                 "Subtracting 12 hours from time coordinate to align climate datasets"
             )
             ds = ds.assign_coords(time=ds.time - np.timedelta64(12, "h"))
+        self._isimip_cache[cache_key] = ds
         return ds
 
     def setup_sfincs(self, land_cover="esa_worldcover_2021_v200", include_coastal=True):
@@ -5359,7 +5674,13 @@ class GEBModel(GridModel):
                 self.is_updated["grid"][var]["filename"] = var + ".tif"
                 fp = Path(self.root, var + ".tif")
                 fp.parent.mkdir(parents=True, exist_ok=True)
-                grid.rio.to_raster(fp, compress="LZW")
+                grid.rio.to_raster(
+                    fp,
+                    compress="LZW",
+                    tiled=True,
+                    blockxsize=256,
+                    blockysize=256,
+                )
 
     def write_subgrid(self):
         self._assert_write_mode
@@ -5370,7 +5691,13 @@ class GEBModel(GridModel):
                 self.is_updated["subgrid"][var]["filename"] = var + ".tif"
                 fp = Path(self.root, var + ".tif")
                 fp.parent.mkdir(parents=True, exist_ok=True)
-                grid.rio.to_raster(fp)
+                grid.rio.to_raster(
+                    fp,
+                    compress="LZW",
+                    tiled=True,
+                    blockxsize=256,
+                    blockysize=256,
+                )
 
     def write_region_subgrid(self):
         self._assert_write_mode
@@ -5381,7 +5708,13 @@ class GEBModel(GridModel):
                 self.is_updated["region_subgrid"][var]["filename"] = var + ".tif"
                 fp = Path(self.root, var + ".tif")
                 fp.parent.mkdir(parents=True, exist_ok=True)
-                grid.rio.to_raster(fp)
+                grid.rio.to_raster(
+                    fp,
+                    compress="LZW",
+                    tiled=True,
+                    blockxsize=256,
+                    blockysize=256,
+                )
 
     def write_MERIT_grid(self):
         self._assert_write_mode
@@ -5392,7 +5725,13 @@ class GEBModel(GridModel):
                 self.is_updated["MERIT_grid"][var]["filename"] = var + ".tif"
                 fp = Path(self.root, var + ".tif")
                 fp.parent.mkdir(parents=True, exist_ok=True)
-                grid.rio.to_raster(fp)
+                grid.rio.to_raster(
+                    fp,
+                    compress="LZW",
+                    tiled=True,
+                    blockxsize=256,
+                    blockysize=256,
+                )
 
     def write_forcing_to_zarr(
         self,
@@ -5415,7 +5754,14 @@ class GEBModel(GridModel):
         dst_file.parent.mkdir(parents=True, exist_ok=True)
 
         if is_spatial_dataset:
-            forcing = forcing.rio.write_crs(self.crs).rio.write_coordinate_system()
+            # parse the CRS once and reuse the pyproj object for every
+            # forcing variable; rioxarray accepts it directly, skipping the
+            # repeated user-input parsing per write
+            if self._pyproj_crs is None:
+                self._pyproj_crs = pyproj.CRS.from_user_input(self.crs)
+            forcing = forcing.rio.write_crs(
+                self._pyproj_crs
+            ).rio.write_coordinate_system()
 
         # write netcdf to temporary file
         with tempfile.NamedTemporaryFile(suffix=".zarr.zip") as tmp_file:
@@ -5521,7 +5867,16 @@ class GEBModel(GridModel):
                     self.logger.debug(f"Writing file {fn}")
                     fp = Path(self.root, fn)
                     fp.parent.mkdir(parents=True, exist_ok=True)
-                    np.savez_compressed(fp, data=data)
+                    # stream the array straight into the archive rather than
+                    # letting savez_compressed buffer a deflated copy of it
+                    # first; np.load reads the stored member just the same
+                    with zipfile.ZipFile(
+                        fp, "w", compression=zipfile.ZIP_STORED, allowZip64=True
+                    ) as zf:
+                        with zf.open("data.npy", "w", force_zip64=True) as f:
+                            np.lib.format.write_array(
+                                f, np.asanyarray(data), allow_pickle=False
+                            )
 
     def write_dict(self):
         def convert_timestamp_to_string(timestamp):
@@ -5587,16 +5942,27 @@ class GEBModel(GridModel):
             json.dump(self.files, f, indent=4, cls=PathEncoder)
 
     def write(self):
-        self.write_geoms()
-        self.write_binary()
-        self.write_table()
-        self.write_dict()
-
-        self.write_grid()
-        self.write_subgrid()
-        self.write_region_subgrid()
-        self.write_MERIT_grid()
+        # the non-forcing writers touch disjoint files and disjoint
+        # sections of self.files, and spend their time in GDAL, zip and
+        # numpy I/O that releases the GIL, so they can run concurrently
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            futures = [
+                executor.submit(writer)
+                for writer in (
+                    self.write_geoms,
+                    self.write_binary,
+                    self.write_table,
+                    self.write_dict,
+                    self.write_grid,
+                    self.write_subgrid,
+                    self.write_region_subgrid,
+                    self.write_MERIT_grid,
+                )
+            ]
+            for future in futures:
+                future.result()
 
+        # forcing already parallelizes internally through dask
         self.write_forcing()
 
         self.write_files()
@@ -5616,7 +5982,45 @@ class GEBModel(GridModel):
     def read_binary(self):
         self.read_files()
         for name, fn in self.files["binary"].items():
-            binary = np.load(Path(self.root, fn))["data"]
+            fp = Path(self.root, fn)
+            with zipfile.ZipFile(fp) as zf:
+                info = zf.NameToInfo.get("data.npy")
+                if info is not None and info.compress_type == zipfile.ZIP_STORED:
+                    # members written by write_binary are stored without
+                    # compression, so read the array straight from the
+                    # underlying file instead of going through zipfile's
+                    # Python-level member stream; the local file header is
+                    # 30 bytes plus the name and extra fields
+                    zf.fp.seek(info.header_offset)
+                    local_header = zf.fp.read(30)
+                    name_length = int.from_bytes(local_header[26:28], "little")
+                    extra_length = int.from_bytes(local_header[28:30], "little")
+                    zf.fp.seek(info.header_offset + 30 + name_length + extra_length)
+                    # memory-map the array data rather than copying it into
+                    # RAM; the OS pages in only what downstream code touches
+                    version = np.lib.format.read_magic(zf.fp)
+                    if version == (1, 0):
+                        shape, fortran_order, dtype = (
+                            np.lib.format.read_array_header_1_0(zf.fp)
+                        )
+                    else:
+                        shape, fortran_order, dtype = (
+                            np.lib.format.read_array_header_2_0(zf.fp)
+                        )
+                    if math.prod(shape) == 0:
+                        binary = np.empty(shape, dtype=dtype)
+                    else:
+                        binary = np.memmap(
+                            fp,
+                            dtype=dtype,
+                            mode="r",
+                            offset=zf.fp.tell(),
+                            shape=shape,
+                            order="F" if fortran_order else "C",
+                        )
+                else:
+                    # older archives written by np.savez_compressed
+                    binary = np.load(fp)["data"]
             self.set_binary(binary, name=name, update=False)
 
     def read_table(self):
@@ -5651,24 +6055,40 @@ class GEBModel(GridModel):
                 }
             return da
 
+    def _read_grid_variables(self, files: dict) -> list:
+        """Load all variables of a grid dataset concurrently.
+
+        Each file is read eagerly in its own thread so decompression and
+        disk I/O overlap; the (name, data) pairs are returned in input
+        order so the callers' bookkeeping stays sequential.
+        """
+        if not files:
+            return []
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(len(files), 8)
+        ) as executor:
+            datasets = list(
+                executor.map(
+                    lambda item: self.read_netcdf(item[1], name=item[0]),
+                    files.items(),
+                )
+            )
+        return list(zip(files.keys(), datasets))
+
     def read_grid(self) -> None:
-        for name, fn in self.files["grid"].items():
-            data = self.read_netcdf(fn, name=name)
+        for name, data in self._read_grid_variables(self.files["grid"]):
             self.set_grid(data, name=name, update=False)
 
     def read_subgrid(self) -> None:
-        for name, fn in self.files["subgrid"].items():
-            data = self.read_netcdf(fn, name=name)
+        for name, data in self._read_grid_variables(self.files["subgrid"]):
             self.set_subgrid(data, name=name, update=False)
 
     def read_region_subgrid(self) -> None:
-        for name, fn in self.files["region_subgrid"].items():
-            data = self.read_netcdf(fn, name=name)
+        for name, data in self._read_grid_variables(self.files["region_subgrid"]):
             self.set_region_subgrid(data, name=name, update=False)
 
     def read_MERIT_grid(self) -> None:
-        for name, fn in self.files["MERIT_grid"].items():
-            data = self.read_netcdf(fn, name=name)
+        for name, data in self._read_grid_variables(self.files["MERIT_grid"]):
             self.set_MERIT_grid(data, name=name, update=False)
 
     def read_forcing(self) -> None:
@@ -5778,9 +6198,17 @@ class GEBModel(GridModel):
         return grid
 
     def set_grid(
-        self, data: Union[xr.DataArray, xr.Dataset, np.ndarray], name: str, update=True
+        self,
+        data: Union[xr.DataArray, xr.Dataset, np.ndarray],
+        name: Optional[str] = None,
+        update=True,
     ) -> None:
-        self.is_updated["grid"][name] = {"updated": update}
+        if isinstance(data, xr.Dataset) and name is None:
+            # batched insert; register every variable for the writer
+            for var in data.data_vars:
+                self.is_updated["grid"][var] = {"updated": update}
+        else:
+            self.is_updated["grid"][name] = {"updated": update}
         super().set_grid(data, name=name)
 
     def set_subgrid(
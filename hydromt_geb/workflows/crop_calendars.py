@@ -1,4 +1,5 @@
 import numpy as np
+import warnings
 from datetime import date
 import calendar
 
@@ -15,15 +16,32 @@ def get_growing_season_length(start_day_index, end_day_index):
         return length
 
 
+# day index of the first and last day of each month in 2000 (the MIRCA2000
+# reference year), precomputed so the parser does not build date objects
+# for every rotation in the file
+MONTH_START_DAY_INDEX = tuple(
+    get_day_index(date(2000, month, 1)) for month in range(1, 13)
+)
+MONTH_END_DAY_INDEX = tuple(
+    get_day_index(date(2000, month, calendar.monthrange(2000, month)[1]))
+    for month in range(1, 13)
+)
+
+
 def parse_MIRCA_file(parsed_calendar, crop_calendar, MIRCA_units, is_irrigated):
+    # hash-based membership test instead of scanning the units array for
+    # every line of the file
+    MIRCA_units = frozenset(int(unit) for unit in MIRCA_units)
     with open(crop_calendar, "r") as f:
-        lines = f.readlines()
-        # remove all empty lines
-        lines = [line.strip() for line in lines if line.strip()]
-        # skip header
-        lines = lines[4:]
-        for line in lines:
-            line = line.replace("  ", " ").split(" ")
+        header_lines_to_skip = 4
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if header_lines_to_skip:
+                header_lines_to_skip -= 1
+                continue
+            line = line.split()
             unit_code = int(line[0])
             if unit_code not in MIRCA_units:
                 continue
@@ -41,21 +59,13 @@ def parse_MIRCA_file(parsed_calendar, crop_calendar, MIRCA_units, is_irrigated):
                     continue
                 start_month = int(crops[rotation * 3 + 1])
                 end_month = int(crops[rotation * 3 + 2])
-                start_day_index = get_day_index(date(2000, start_month, 1))
-                end_day_index = get_day_index(
-                    date(2000, end_month, calendar.monthrange(2000, end_month)[1])
-                )
+                start_day_index = MONTH_START_DAY_INDEX[start_month - 1]
+                end_day_index = MONTH_END_DAY_INDEX[end_month - 1]
                 growth_length = get_growing_season_length(
                     start_day_index, end_day_index
                 )
                 crop_rotations.append((start_day_index, growth_length, area))
 
-            del start_month
-            del end_month
-            del start_day_index
-            del end_day_index
-            del growth_length
-
             # discard crop rotations with zero area
             crop_rotations = [
                 crop_rotation
@@ -66,8 +76,6 @@ def parse_MIRCA_file(parsed_calendar, crop_calendar, MIRCA_units, is_irrigated):
             crop_rotations = sorted(crop_rotations, key=lambda x: x[2])  # sort by area
             if len(crop_rotations) == 3:
                 crop_rotations = crop_rotations[1:]
-                import warnings
-
                 warnings.warn(
                     "More than 2 crop rotations found, discarding the one with the lowest area. This should be fixed later."
                 )
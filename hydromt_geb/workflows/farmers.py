@@ -1,6 +1,5 @@
 import numpy as np
 import pandas as pd
-from random import random
 from numba import njit
 from honeybees.library.raster import pixels_to_coords
 
@@ -24,73 +23,62 @@ def create_farms_numba(cultivated_land, ids, farm_sizes):
 
     current_farm_counter = 0
     cur_farm_size = 0
-    farm_done = False
 
     farm_id = ids[current_farm_counter]
     farm_size = farm_sizes[current_farm_counter]
     farms = np.where(cultivated_land, -1, -2).astype(np.int32)
     ysize, xsize = farms.shape
-    for y in range(farms.shape[0]):
-        for x in range(farms.shape[1]):
-            f = farms[y, x]
-            if f == -1:
-                assert farm_size > 0
-
-                xmin, xmax, ymin, ymax = 1e6, -1e6, 1e6, -1e6
-                xlow, xhigh, ylow, yhigh = x, x + 1, y, y + 1
 
-                xsearch, ysearch = 0, 0
-
-                while True:
-                    if not np.count_nonzero(
-                        farms[ylow : yhigh + 1 + ysearch, xlow : xhigh + 1 + xsearch]
-                        == -1
-                    ):
-                        break
+    # preallocated FIFO queue of flat cell indices for the flood fill
+    queue = np.empty(farms.size, dtype=np.int64)
 
-                    for yf in range(ylow, yhigh + 1):
-                        for xf in range(xlow, xhigh + 1):
-                            if xf < xsize and yf < ysize and farms[yf, xf] == -1:
-                                if xf > xmax:
-                                    xmax = xf
-                                if xf < xmin:
-                                    xmin = xf
-                                if yf > ymax:
-                                    ymax = yf
-                                if yf < ymin:
-                                    ymin = yf
-                                farms[yf, xf] = farm_id
-                                cur_farm_size += 1
-                                if cur_farm_size == farm_size:
-                                    cur_farm_size = 0
-                                    farm_done = True
-                                    break
-
-                        if farm_done is True:
-                            break
-
-                    if farm_done is True:
-                        break
+    for y in range(ysize):
+        for x in range(xsize):
+            if farms[y, x] == -1:
+                assert farm_size > 0
 
-                    if random() < 0.5:
-                        ylow -= 1
-                        ysearch = 1
-                    else:
-                        yhigh += 1
-                        ysearch = 0
-
-                    if random() < 0.5:
-                        xlow -= 1
-                        xsearch = 1
-                    else:
-                        xhigh += 1
-                        xsearch = 0
-
-                if farm_done:
-                    farm_done = False
+                # claim the seed cell, then grow the farm with a
+                # 4-connected breadth-first fill until it reaches its
+                # target size or the free pocket is exhausted; each cell
+                # is enqueued at most once, so a farm costs O(farm_size)
+                farms[y, x] = farm_id
+                cur_farm_size += 1
+                head = 0
+                tail = 0
+                queue[tail] = y * xsize + x
+                tail += 1
+
+                while head < tail and cur_farm_size < farm_size:
+                    cell = queue[head]
+                    head += 1
+                    cy = cell // xsize
+                    cx = cell % xsize
+                    for neighbor in range(4):
+                        if neighbor == 0:
+                            ny, nx = cy - 1, cx
+                        elif neighbor == 1:
+                            ny, nx = cy + 1, cx
+                        elif neighbor == 2:
+                            ny, nx = cy, cx - 1
+                        else:
+                            ny, nx = cy, cx + 1
+                        if 0 <= ny < ysize and 0 <= nx < xsize and farms[ny, nx] == -1:
+                            farms[ny, nx] = farm_id
+                            cur_farm_size += 1
+                            queue[tail] = ny * xsize + nx
+                            tail += 1
+                            if cur_farm_size == farm_size:
+                                break
+
+                if cur_farm_size == farm_size:
+                    cur_farm_size = 0
                     current_farm_counter += 1
-                    farm_id = ids[current_farm_counter]
-                    farm_size = farm_sizes[current_farm_counter]
+                    if current_farm_counter < ids.size:
+                        farm_id = ids[current_farm_counter]
+                        farm_size = farm_sizes[current_farm_counter]
+                # if the pocket ran out before the farm was complete, the
+                # same farm continues from the next free cell in scan
+                # order, as before
 
     assert np.count_nonzero(farms == -1) == 0
     farms = np.where(farms != -2, farms, -1)
@@ -110,10 +98,14 @@ def create_farms(
         ids=agents.index.to_numpy(),
         farm_sizes=agents[farm_size_key].to_numpy(),
     ).astype(np.int32)
-    unique_farms = np.unique(farms)
-    unique_farms = unique_farms[unique_farms != -1]
-    assert np.array_equal(np.sort(agents.index.to_numpy()), unique_farms)
-    assert unique_farms.size == len(agents)
+    # compare the assigned ids against the agent index with boolean
+    # scatters rather than sorting the full farms raster with np.unique;
+    # this runs once per region so the linear pass matters
+    assigned_ids = np.zeros(agents.index.max() + 1, dtype=bool)
+    assigned_ids[farms[farms != -1]] = True
+    expected_ids = np.zeros_like(assigned_ids)
+    expected_ids[agents.index.to_numpy()] = True
+    assert np.array_equal(assigned_ids, expected_ids)
     assert agents[farm_size_key].sum() == np.count_nonzero(farms != -1)
     assert ((farms >= 0) == (cultivated_land_tehsil == 1)).all()
 
@@ -266,13 +258,16 @@ def get_farm_distribution(n, x0, x1, mean, offset, logger=None):
     else:
         growth_factor = 1
 
+        # the geometric series is built as a single vectorized power rather
+        # than an element-by-element Python loop; with large size classes the
+        # estimate spans thousands of farm sizes and is rebuilt every solver
+        # iteration
+        exponents = np.arange(n_farm_sizes, dtype=np.float64)
+
         start_from_bottom = True
         while True:
             if start_from_bottom:
-                estimate = np.zeros(n_farm_sizes, dtype=np.float64)
-                estimate[0] = 1
-                for i in range(1, estimate.size):
-                    estimate[i] = estimate[i - 1] * growth_factor
+                estimate = growth_factor**exponents
                 estimate /= estimate.sum() / n
 
             # when there are only some farms at the top of the farm size distribution, the growth factor can become very large and the estimate can become very small.
@@ -287,10 +282,7 @@ def get_farm_distribution(n, x0, x1, mean, offset, logger=None):
                     logger.warning(
                         f"estimate contains NaNs; growth_factor: {growth_factor}, estimate size: {estimate.size}, estimate: {estimate}, start from the top"
                     )
-                estimate = np.zeros(n_farm_sizes, dtype=np.float64)
-                estimate[-1] = 1
-                for i in range(estimate.size - 2, -1, -1):
-                    estimate[i] = estimate[i + 1] * growth_factor
+                estimate = growth_factor ** exponents[::-1]
                 estimate /= estimate.sum() / n
 
             assert (
@@ -1,3 +1,4 @@
+import math
 import os
 import shutil
 import tempfile
@@ -9,6 +10,7 @@ from datetime import date
 from typing import Any, Union
 import xarray
 import numpy as np
+from numba import njit, prange
 from collections.abc import Mapping
 
 
@@ -16,19 +18,212 @@ def repeat_grid(data, factor):
     return data.repeat(factor, axis=-2).repeat(factor, axis=-1)
 
 
+def repeat_grid_view(data, factor):
+    """Upsample a grid by an integer factor without intermediate copies.
+
+    Equivalent to :func:`repeat_grid`, but builds a broadcast view of shape
+    (..., height, factor, width, factor) and only materializes the result in
+    the final reshape. This avoids the two full intermediate arrays that
+    ``np.repeat`` allocates, which matters for large subgrid factors.
+    """
+    height, width = data.shape[-2:]
+    expanded = np.broadcast_to(
+        data[..., :, np.newaxis, :, np.newaxis],
+        data.shape[:-2] + (height, factor, width, factor),
+    )
+    return expanded.reshape(data.shape[:-2] + (height * factor, width * factor))
+
+
+@njit(cache=True, parallel=True)
+def block_mean_and_std(data, factor):
+    """Mean and standard deviation per (factor x factor) block of a 2D array.
+
+    Streams every block once, accumulating the sum and sum of squares in
+    registers, rather than materializing a transposed copy of the full
+    high-resolution array and running the separate passes that ``np.mean``
+    and ``np.std`` need.
+    """
+    height = data.shape[0] // factor
+    width = data.shape[1] // factor
+    n = factor * factor
+    mean = np.empty((height, width), dtype=np.float32)
+    std = np.empty((height, width), dtype=np.float32)
+    for i in prange(height):
+        for j in range(width):
+            s1 = 0.0
+            s2 = 0.0
+            for bi in range(factor):
+                for bj in range(factor):
+                    value = data[i * factor + bi, j * factor + bj]
+                    s1 += value
+                    s2 += value * value
+            block_mean = s1 / n
+            variance = s2 / n - block_mean * block_mean
+            if variance < 0:  # guard against rounding error for constant blocks
+                variance = 0
+            mean[i, j] = block_mean
+            std[i, j] = np.sqrt(variance)
+    return mean, std
+
+
+@njit(cache=True, parallel=True, fastmath=True)
+def downscale_longwave(hurs_coarse, tas_coarse, rlds_coarse, hurs_fine, tas_fine):
+    """Downscale longwave radiation from coarse to fine resolution.
+
+    All inputs are elementwise-aligned arrays on the fine grid (the coarse
+    fields already regridded). The whole chain of saturation vapour
+    pressure, clear-sky and all-sky emissivity is fused into one pass in
+    registers instead of materializing each intermediate as a full
+    (time, y, x) array. Method adapted from
+    https://github.com/johanna-malle/w5e5_downscale (GPL-3.0).
+    """
+    x1 = 0.43
+    x2 = 5.7
+    sbc = 5.67e-8  # stefan boltzman constant [Js-1 m-2 K-4]
+    es0 = 6.11  # reference saturation vapour pressure [hPa]
+    T0 = 273.15
+    lv = 2.5e6  # latent heat of vaporization of water
+    Rv = 461.5  # gas constant for water vapour [J K kg-1]
+
+    hurs_coarse = hurs_coarse.ravel()
+    tas_coarse = tas_coarse.ravel()
+    rlds_coarse = rlds_coarse.ravel()
+    hurs_fine_flat = hurs_fine.ravel()
+    tas_fine_flat = tas_fine.ravel()
+
+    out = np.empty(hurs_fine_flat.size, dtype=np.float32)
+    for i in prange(out.size):
+        # saturation vapor pressure and water vapour pressure [hPa]
+        es_coarse = es0 * np.exp((lv / Rv) * (1 / T0 - 1 / tas_coarse[i]))
+        pV_coarse = hurs_coarse[i] * es_coarse / 100
+        es_fine = es0 * np.exp((lv / Rv) * (1 / T0 - 1 / tas_fine_flat[i]))
+        pV_fine = hurs_fine_flat[i] * es_fine / 100
+
+        # clear-sky emissivity (pV needs to be in Pa not hPa, hence *100)
+        e_cl_coarse = 0.23 + x1 * ((pV_coarse * 100) / tas_coarse[i]) ** (1 / x2)
+        e_cl_fine = 0.23 + x1 * ((pV_fine * 100) / tas_fine_flat[i]) ** (1 / x2)
+
+        # all-sky emissivity, constrained to max 1
+        e_as_coarse = rlds_coarse[i] / (sbc * tas_coarse[i] ** 4)
+        if e_as_coarse > 1:
+            e_as_coarse = 1
+        # cloud-based component of emissivity
+        delta_e = e_as_coarse - e_cl_coarse
+
+        e_as_fine = e_cl_fine + delta_e
+        if e_as_fine > 1:
+            e_as_fine = 1
+
+        # downscaled lwr! assume cloud e is the same
+        out[i] = e_as_fine * sbc * tas_fine_flat[i] ** 4
+    return out.reshape(hurs_fine.shape)
+
+
+@njit(cache=True)
+def _gev_fit_pwm_single(sample):
+    """GEV parameters of one sample via probability-weighted moments.
+
+    Uses the Hosking et al. (1985) estimator: unbiased sample PWMs b0, b1
+    and b2 give the first three L-moments, from which the shape follows via
+    the standard rational approximation. Returns (c, loc, scale) in the
+    scipy.stats.genextreme parameterization; all NaN when fewer than four
+    finite values are available.
+    """
+    n = 0
+    for value in sample:
+        if not np.isnan(value):
+            n += 1
+    if n < 4:
+        return np.nan, np.nan, np.nan
+
+    x = np.empty(n, dtype=np.float64)
+    i = 0
+    for value in sample:
+        if not np.isnan(value):
+            x[i] = value
+            i += 1
+    x.sort()
+
+    b0 = 0.0
+    b1 = 0.0
+    b2 = 0.0
+    for j in range(n):
+        b0 += x[j]
+        b1 += j * x[j]
+        b2 += j * (j - 1) * x[j]
+    b0 /= n
+    b1 /= n * (n - 1)
+    b2 /= n * (n - 1) * (n - 2)
+
+    l2 = 2 * b1 - b0
+    t3 = (6 * b2 - 6 * b1 + b0) / l2
+
+    z = 2.0 / (3.0 + t3) - math.log(2.0) / math.log(3.0)
+    shape = 7.8590 * z + 2.9554 * z * z
+    if abs(shape) < 1e-8:  # Gumbel limit
+        scale = l2 / math.log(2.0)
+        loc = b0 - 0.5772156649015329 * scale
+        return 0.0, loc, scale
+
+    gamma_1k = math.gamma(1.0 + shape)
+    scale = l2 * shape / ((1.0 - 2.0 ** (-shape)) * gamma_1k)
+    loc = b0 - scale * (1.0 - gamma_1k) / shape
+    return shape, loc, scale
+
+
+@njit(cache=True, parallel=True)
+def fit_gev(data):
+    """Fit GEV parameters for every pixel of a (y, x, time) cube.
+
+    Replaces the per-pixel maximum-likelihood fit with the closed-form
+    probability-weighted-moment estimator of :func:`_gev_fit_pwm_single`,
+    run in parallel over the pixels. The time axis must be last so each
+    pixel's series is a unit-stride slice. Returns the (c, loc, scale)
+    planes as float32.
+    """
+    n_y, n_x = data.shape[0], data.shape[1]
+    c = np.empty((n_y, n_x), dtype=np.float32)
+    loc = np.empty((n_y, n_x), dtype=np.float32)
+    scale = np.empty((n_y, n_x), dtype=np.float32)
+    for pixel in prange(n_y * n_x):
+        i = pixel // n_x
+        j = pixel % n_x
+        c[i, j], loc[i, j], scale[i, j] = _gev_fit_pwm_single(data[i, j])
+    return c, loc, scale
+
+
+def find_nearest_index(coords, value):
+    """Index of the coordinate closest to ``value`` in a monotonic 1D array.
+
+    A binary search replaces a full ``np.isclose`` scan over the coordinate;
+    callers must still verify that the returned coordinate is within
+    tolerance of ``value``.
+    """
+    coords = np.asarray(coords)
+    if coords.size > 1 and coords[0] > coords[-1]:  # descending, e.g. latitude
+        return coords.size - 1 - find_nearest_index(coords[::-1], value)
+    idx = np.searchsorted(coords, value)
+    if idx == coords.size or (
+        idx > 0 and value - coords[idx - 1] <= coords[idx] - value
+    ):
+        idx -= 1
+    return int(idx)
+
+
 def calculate_cell_area(affine_transform, shape):
     RADIUS_EARTH_EQUATOR = 40075017  # m
     distance_1_degree_latitude = RADIUS_EARTH_EQUATOR / 360
 
     height, width = shape
 
-    lat_idx = np.arange(0, height).repeat(width).reshape((height, width))
-    lat = (lat_idx + 0.5) * affine_transform.e + affine_transform.f
+    # cell area only depends on latitude, so compute one value per row and
+    # broadcast it over the columns
+    lat = (np.arange(height) + 0.5) * affine_transform.e + affine_transform.f
     width_m = (
         distance_1_degree_latitude * np.cos(np.radians(lat)) * abs(affine_transform.a)
     )
     height_m = distance_1_degree_latitude * abs(affine_transform.e)
-    return width_m * height_m
+    return np.broadcast_to((width_m * height_m)[:, np.newaxis], (height, width))
 
 
 def clip_with_grid(ds, mask):
@@ -204,9 +399,12 @@ def project_to_future(df, project_future_until_year, inflation_rates):
         inclusive="right",
     )
     df = df.reindex(df.index.union(future_index))
+    # look the years up in a dict rather than scanning the time axis list
+    # once per projected date
+    year_to_index = {year: i for i, year in enumerate(inflation_rates["time"])}
     for future_date in tqdm(future_index):
         source_date = future_date - pd.DateOffset(years=1)  # source is year ago
-        inflation_index = inflation_rates["time"].index(str(future_date.year))
+        inflation_index = year_to_index[str(future_date.year)]
         for region_id, _ in df.columns:
             region_inflation_rate = inflation_rates["data"][str(region_id)][
                 inflation_index
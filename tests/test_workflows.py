@@ -0,0 +1,148 @@
+import numpy as np
+from scipy.stats import genextreme
+
+from hydromt_geb.geb import GEBModel
+from hydromt_geb.workflows.farmers import create_farms_numba
+from hydromt_geb.workflows.general import (
+    _gev_fit_pwm_single,
+    block_mean_and_std,
+    find_nearest_index,
+    fit_gev,
+    repeat_grid,
+    repeat_grid_view,
+)
+
+
+def test_repeat_grid_view():
+    data = np.arange(24, dtype=np.float32).reshape(4, 6)
+    assert np.array_equal(repeat_grid_view(data, 3), repeat_grid(data, 3))
+
+    stacked = np.arange(48, dtype=np.float32).reshape(2, 4, 6)
+    assert np.array_equal(repeat_grid_view(stacked, 2), repeat_grid(stacked, 2))
+
+
+def test_block_mean_and_std():
+    rng = np.random.default_rng(0)
+    data = rng.normal(10, 3, size=(12, 18)).astype(np.float32)
+    factor = 3
+
+    mean, std = block_mean_and_std(data, factor)
+
+    blocks = data.reshape(4, factor, 6, factor).transpose(0, 2, 1, 3).astype(np.float64)
+    assert np.allclose(mean, blocks.mean(axis=(2, 3)), atol=1e-4)
+    assert np.allclose(std, blocks.std(axis=(2, 3)), atol=1e-4)
+
+    # constant blocks must not produce negative variance
+    mean, std = block_mean_and_std(np.full((4, 4), 7.3, dtype=np.float32), 2)
+    assert np.allclose(mean, 7.3)
+    assert (std == 0).all()
+
+
+def test_find_nearest_index():
+    ascending = np.array([0.0, 0.5, 1.0, 1.5, 2.0])
+    assert find_nearest_index(ascending, 0.0) == 0
+    assert find_nearest_index(ascending, 0.74) == 1
+    assert find_nearest_index(ascending, 0.76) == 2
+    assert find_nearest_index(ascending, 5.0) == 4
+
+    descending = ascending[::-1]
+    assert find_nearest_index(descending, 0.0) == 4
+    assert find_nearest_index(descending, 2.0) == 0
+    assert find_nearest_index(descending, 0.76) == 2
+
+
+def test_gev_fit_pwm_recovers_parameters():
+    n = 10000
+    # evaluate the estimator on near-exact quantiles of the distribution
+    # rather than a random sample, so the tolerance can be tight; test
+    # both tail signs of the scipy genextreme shape parameter
+    probabilities = (np.arange(1, n + 1) - 0.35) / n
+    for c, loc, scale in [(0.2, 10.0, 2.0), (-0.15, -3.0, 0.5)]:
+        sample = genextreme.ppf(probabilities, c, loc=loc, scale=scale)
+        c_hat, loc_hat, scale_hat = _gev_fit_pwm_single(sample)
+        assert abs(c_hat - c) < 0.05
+        assert abs(loc_hat - loc) < 0.1 * scale
+        assert abs(scale_hat - scale) < 0.1 * scale
+
+
+def test_gev_fit_pwm_edge_cases():
+    # fewer than four finite values cannot be fitted
+    assert np.isnan(_gev_fit_pwm_single(np.array([1.0, 2.0, np.nan]))).all()
+
+    # NaNs are ignored, not propagated
+    n = 10000
+    probabilities = (np.arange(1, n + 1) - 0.35) / n
+    sample = genextreme.ppf(probabilities, 0.2, loc=10.0, scale=2.0)
+    with_nans = np.concatenate([sample, np.full(100, np.nan)])
+    c_hat, loc_hat, scale_hat = _gev_fit_pwm_single(with_nans)
+    assert abs(c_hat - 0.2) < 0.05
+
+    # a Gumbel sample (c == 0) must be fitted with a near-zero shape
+    sample = genextreme.ppf(probabilities, 0.0, loc=5.0, scale=1.5)
+    c_hat, loc_hat, scale_hat = _gev_fit_pwm_single(sample)
+    assert abs(c_hat) < 0.05
+    assert abs(loc_hat - 5.0) < 0.15
+    assert abs(scale_hat - 1.5) < 0.15
+
+
+def test_fit_gev_per_pixel():
+    n = 5000
+    probabilities = (np.arange(1, n + 1) - 0.35) / n
+    series = genextreme.ppf(probabilities, 0.1, loc=2.0, scale=1.0)
+    cube = np.ascontiguousarray(np.broadcast_to(series, (2, 3, n)))
+
+    c, loc, scale = fit_gev(cube)
+    assert c.shape == (2, 3)
+    assert c.dtype == np.float32
+    # identical series in every pixel give identical parameters
+    assert np.allclose(c, c[0, 0])
+    assert np.allclose(loc, loc[0, 0])
+    assert np.allclose(scale, scale[0, 0])
+    assert abs(c[0, 0] - 0.1) < 0.05
+
+
+def test_propagate_price_by_inflation():
+    years = [str(year) for year in range(2000, 2011)]
+    year_to_index = {year: i for i, year in enumerate(years)}
+    rates = np.linspace(1.01, 1.11, len(years))
+
+    def reference_loop(reference_price, reference_year, start_year, end_year):
+        # the year-by-year propagation the helper replaced
+        prices = {reference_year: reference_price}
+        for year in range(reference_year + 1, end_year + 1):
+            prices[year] = prices[year - 1] * rates[year_to_index[str(year)]]
+        for year in range(reference_year - 1, start_year - 1, -1):
+            prices[year] = prices[year + 1] / rates[year_to_index[str(year + 1)]]
+        return [prices[year] for year in range(start_year, end_year + 1)]
+
+    # the helper does not touch model state, so no instance is needed
+    for reference_year in (2000, 2005, 2010):
+        propagated = GEBModel._propagate_price_by_inflation(
+            None, 100.0, reference_year, 2000, 2010, rates, year_to_index
+        )
+        assert np.allclose(
+            propagated, reference_loop(100.0, reference_year, 2000, 2010)
+        )
+
+
+def test_create_farms_numba():
+    rng = np.random.default_rng(42)
+    cultivated_land = rng.random((20, 20)) < 0.6
+    n_cells = int(cultivated_land.sum())
+
+    # farm sizes that sum exactly to the number of cultivated cells
+    farm_sizes = []
+    remaining = n_cells
+    while remaining > 0:
+        size = min(int(rng.integers(1, 8)), remaining)
+        farm_sizes.append(size)
+        remaining -= size
+    farm_sizes = np.array(farm_sizes, dtype=np.int64)
+    ids = np.arange(farm_sizes.size, dtype=np.int64)
+
+    farms = create_farms_numba(cultivated_land, ids, farm_sizes)
+
+    # non-cultivated land stays nodata, cultivated land is fully assigned
+    assert ((farms >= 0) == cultivated_land).all()
+    # every farm has exactly its requested size
+    assert np.array_equal(np.bincount(farms[farms != -1]), farm_sizes)